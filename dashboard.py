@@ -7,43 +7,50 @@ Automatically stops and restarts if already running.
 
 import sys
 import os
-import signal
-import atexit
+import asyncio
 import time
+from operator import itemgetter
 from pathlib import Path
 
 # Environment detection and setup
 def setup_uv_environment():
     """Detect and setup uv environment if available."""
     try:
-        import subprocess
-        # Check if uv is available
-        result = subprocess.run(['which', 'uv'], capture_output=True, text=True)
-        if result.returncode == 0:
-            # uv is available, check if we're already running under uv
-            # UV_RUN_RECURSION_DEPTH is set when running under uv
-            if 'UV_RUN_RECURSION_DEPTH' not in os.environ:
-                # We're not running under uv, restart with uv
-                print("🔄 Restarting with uv environment...")
-                env = os.environ.copy()
-                env['__UV_RESTARTED'] = '1'
-                os.execvpe('uv', ['uv', 'run', '--script', sys.argv[0]] + sys.argv[1:], env)
+        import shutil
+        # Already restarted once, or already inside an activated venv: nothing to do
+        if os.environ.get('__UV_RESTARTED') or os.environ.get('VIRTUAL_ENV'):
+            return
+        # UV_RUN_RECURSION_DEPTH is set when running under uv
+        if 'UV_RUN_RECURSION_DEPTH' in os.environ:
+            return
+        # Prefer activating the project's existing .venv in-process over
+        # re-launching the interpreter under `uv run`
+        from src.venv_setup import activate_venv
+        venv = Path(__file__).parent / '.venv'
+        if activate_venv(venv):
+            return
+        # Check if uv is available (PATH lookup, no subprocess)
+        if shutil.which('uv'):
+            # We're not running under uv, restart with uv
+            print("🔄 Restarting with uv environment...")
+            env = os.environ.copy()
+            env['__UV_RESTARTED'] = '1'
+            os.execvpe('uv', ['uv', 'run', '--script', sys.argv[0]] + sys.argv[1:], env)
     except Exception:
         # If anything fails, just continue with current environment
         pass
 
-# Setup uv environment if available
-setup_uv_environment()
+# Setup uv environment if available (only when run as a script; ASGI worker
+# processes importing "dashboard:app" must not re-exec themselves)
+if __name__ == "__main__":
+    setup_uv_environment()
 
 # Add src directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from fastapi import FastAPI, Request
-from fastapi.responses import HTMLResponse, JSONResponse
-from fastapi.staticfiles import StaticFiles
-from fastapi.templating import Jinja2Templates
-import uvicorn
-
+# Only the registry helpers are imported eagerly; Starlette, uvicorn and
+# orjson are deferred to _build_app()/main() so early exits (port conflict,
+# uv re-exec) never pay for them.
 from src.port_manager import (
     get_all_servers,
     cleanup_stale_servers,
@@ -54,91 +61,196 @@ from src.port_manager import (
 )
 
 
-# Initialize FastAPI app
-app = FastAPI(
-    title="TodoTracker Dashboard",
-    description="Central dashboard for all TodoTracker instances",
-    version="1.0.0"
-)
+BANNER = "\n".join([
+    "╔" + "=" * 58 + "╗",
+    "║" + " " * 12 + "📊 TodoTracker Dashboard" + " " * 22 + "║",
+    "║" + " " * 10 + "Multi-Project Server Manager" + " " * 19 + "║",
+    "╚" + "=" * 58 + "╝",
+])
+RULE = "=" * 60
 
-# Mount static files and templates
-try:
-    app.mount("/static", StaticFiles(directory="static"), name="static")
-except Exception:
-    pass  # Static directory might not exist or already mounted
+# Set in the environment of gunicorn-managed workers: the master process owns
+# the registry entry (see when_ready/on_exit), so workers must neither
+# register nor unregister it.
+GUNICORN_ENV_FLAG = "__TT_DASHBOARD_GUNICORN"
 
-templates = Jinja2Templates(directory="templates")
+# Short-lived cache for get_all_servers(): page loads and API polls that land
+# within the TTL share one registry read instead of each rescanning it.
+SERVERS_CACHE_TTL = 1.0
+_servers_cache = {"ts": 0.0, "val": None}
+_servers_lock = asyncio.Lock()
 
+_app = None
 
-@app.get("/", response_class=HTMLResponse)
-async def dashboard_home(request: Request):
-    """Main dashboard page showing all running TodoTracker servers."""
-    servers = get_all_servers()
-    
-    # Sort by port number
-    servers.sort(key=lambda x: x.get("port", 0))
-    
-    # Calculate summary stats
-    total_servers = len(servers)
-    running_servers = sum(1 for s in servers if s.get("is_running", False))
-    
-    return templates.TemplateResponse(
-        "dashboard.html",
-        {
-            "request": request,
-            "servers": servers,
-            "total_servers": total_servers,
-            "running_servers": running_servers,
-        }
+
+async def cached_servers():
+    """Return get_all_servers(), coalescing concurrent calls within the TTL."""
+    async with _servers_lock:
+        now = time.monotonic()
+        if _servers_cache["val"] is None or now - _servers_cache["ts"] > SERVERS_CACHE_TTL:
+            _servers_cache["val"] = await asyncio.to_thread(get_all_servers)
+            _servers_cache["ts"] = now
+        return list(_servers_cache["val"])
+
+
+def _build_app():
+    """Import the web stack and construct the Starlette app (once)."""
+    global _app
+    if _app is not None:
+        return _app
+
+    from contextlib import asynccontextmanager
+
+    import orjson
+    from starlette.applications import Starlette
+    from starlette.middleware import Middleware
+    from starlette.middleware.gzip import GZipMiddleware
+    from starlette.responses import JSONResponse, Response
+    from starlette.routing import Route, Mount
+    from starlette.staticfiles import StaticFiles
+    from starlette.templating import Jinja2Templates
+
+    if not Path("templates").is_dir():
+        raise RuntimeError("templates/ directory not found; run the dashboard from the TodoTracker root")
+    # Persist compiled template bytecode across runs so cold starts skip the
+    # Jinja2 parse/codegen step; templates don't change while the server runs.
+    # No directory argument: Jinja2's default is a per-user, mode-0700 temp
+    # dir whose ownership it verifies, so other users can't plant bytecode.
+    from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+    env = Environment(
+        loader=FileSystemLoader("templates"),
+        bytecode_cache=FileSystemBytecodeCache(),
+        auto_reload=False,
+        autoescape=True,
     )
+    templates = Jinja2Templates(env=env)
+
+    # The home page is a static shell: render it once and serve the bytes.
+    # Server data is fetched by the page itself from /api/servers.
+    shell_html = templates.get_template("dashboard.html").render().encode("utf-8")
+
+    class ORJSONResponse(JSONResponse):
+        """JSONResponse rendered with orjson, which encodes straight to bytes."""
 
+        def render(self, content) -> bytes:
+            return orjson.dumps(content)
 
-@app.get("/api/servers", response_model=list)
-async def api_get_servers():
-    """API endpoint to get all servers as JSON."""
-    servers = get_all_servers()
-    return servers
+    async def dashboard_home(request):
+        """Main dashboard page showing all running TodoTracker servers."""
+        return Response(shell_html, media_type="text/html")
 
+    async def api_get_servers(request):
+        """API endpoint to get all servers as JSON, sorted by port."""
+        servers = await cached_servers()
+        # register_server always records a port
+        servers.sort(key=itemgetter("port"))
+        return ORJSONResponse(servers)
 
-@app.get("/api/cleanup")
-async def api_cleanup():
-    """API endpoint to manually trigger cleanup of stale servers."""
-    servers = cleanup_stale_servers()
-    return {
-        "message": "Cleanup completed",
-        "active_servers": len(servers)
-    }
+    async def api_cleanup(request):
+        """API endpoint to manually trigger cleanup of stale servers."""
+        # Registry rewrite + per-PID probes are blocking; keep them off the loop
+        servers = await asyncio.to_thread(cleanup_stale_servers)
+        _servers_cache["val"] = None  # Force the next read to see the cleaned registry
+        return ORJSONResponse({
+            "message": "Cleanup completed",
+            "active_servers": len(servers)
+        })
 
+    async def health_check(request):
+        """Health check endpoint."""
+        return ORJSONResponse({
+            "status": "ok",
+            "service": "todotracker-dashboard",
+            "port": 8069
+        })
 
-@app.get("/api/health")
-async def health_check():
-    """Health check endpoint."""
-    return {
-        "status": "ok",
-        "service": "todotracker-dashboard",
-        "port": 8069
-    }
+    @asynccontextmanager
+    async def lifespan(app):
+        """Register the dashboard on startup and unregister it exactly once on shutdown."""
+        # Under gunicorn the master owns the entry (when_ready/on_exit hooks)
+        owns_registration = not os.environ.get(GUNICORN_ENV_FLAG)
+        if owns_registration:
+            register_server("TodoTracker Dashboard", "dashboard", 8069, os.getpid())
+        print("✓ TodoTracker Dashboard initialized")
+        try:
+            yield
+        finally:
+            print("✓ TodoTracker Dashboard shutting down")
+            if owns_registration:
+                unregister_server(8069)
 
+    # Plain Starlette app: the dashboard routes take no request bodies and need
+    # no validation, so FastAPI's dependency/response-model machinery is skipped.
+    routes = [
+        Route("/", dashboard_home),
+        Route("/api/servers", api_get_servers),
+        Route("/api/cleanup", api_cleanup),
+        Route("/api/health", health_check),
+    ]
 
-@app.on_event("startup")
-async def startup_event():
-    """Initialize on startup."""
-    print("✓ TodoTracker Dashboard initialized")
+    # Mount static files (the directory might not exist)
+    if Path("static").is_dir():
+        routes.append(Mount("/static", StaticFiles(directory="static"), name="static"))
 
+    # The server list grows with every registered project; compress it (and
+    # the page shell) for browsers polling over slow links.
+    middleware = [Middleware(GZipMiddleware, minimum_size=500)]
 
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Cleanup on shutdown."""
-    print("✓ TodoTracker Dashboard shutting down")
+    _app = Starlette(routes=routes, middleware=middleware, lifespan=lifespan)
+    return _app
+
+
+def __getattr__(name):
+    # Keep `dashboard.app` / "dashboard:app" working for ASGI servers.
+    if name == "app":
+        return _build_app()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# gunicorn server hooks. exec_gunicorn() passes this file as the gunicorn
+# config (-c), so these run once, in the master: register when the workers
+# are ready, unregister when the master exits.
+def when_ready(server):
+    register_server("TodoTracker Dashboard", "dashboard", 8069, server.pid)
+
+
+def on_exit(server):
     unregister_server(8069)
 
 
+def exec_gunicorn(workers: int):
+    """Replace this process with a gunicorn master running `workers` uvicorn workers."""
+    import shutil
+    if not shutil.which("gunicorn"):
+        print("\n⚠️  gunicorn not found (pip install gunicorn); running a single worker instead")
+        return
+    print(f"🧵 Starting {workers} uvicorn workers under gunicorn")
+    env = os.environ.copy()
+    env[GUNICORN_ENV_FLAG] = "1"
+    os.execvpe("gunicorn", [
+        "gunicorn",
+        "-k", "uvicorn.workers.UvicornWorker",
+        "-w", str(workers),
+        "--bind", "0.0.0.0:8069",
+        "--pythonpath", str(Path(__file__).parent),
+        "-c", str(Path(__file__).resolve()),
+        "dashboard:app",
+    ], env)
+
+
 def main():
     """Main entry point."""
-    print("╔" + "="*58 + "╗")
-    print("║" + " "*12 + "📊 TodoTracker Dashboard" + " "*22 + "║")
-    print("║" + " "*10 + "Multi-Project Server Manager" + " "*19 + "║")
-    print("╚" + "="*58 + "╝")
+    import argparse
+    parser = argparse.ArgumentParser(description="TodoTracker multi-project dashboard")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes; >1 runs uvicorn workers under gunicorn (default: 1)"
+    )
+    args = parser.parse_args()
+    
+    print(BANNER)
     
     # Check if port 8069 is already in use
     if not is_port_available(8069):
@@ -152,48 +264,49 @@ def main():
             print("   sudo lsof -ti:8069 | xargs kill -9")
             sys.exit(1)
     
-    print("\n" + "="*60)
+    print("\n" + RULE)
     print("🚀 Starting TodoTracker Dashboard")
-    print("="*60)
+    print(RULE)
     print(f"\n📊 Dashboard URL: http://localhost:8069")
-    print(f"🌐 API Docs: http://localhost:8069/docs")
+    print(f"🌐 Health: http://localhost:8069/api/health")
     print("\nThe dashboard shows all running TodoTracker instances.")
     print("Press Ctrl+C to stop the dashboard\n")
     
-    # Register dashboard server
-    pid = os.getpid()
-    register_server("TodoTracker Dashboard", "dashboard", 8069, pid)
+    if args.workers > 1:
+        # The gunicorn master registers itself via when_ready (exec keeps our PID)
+        exec_gunicorn(args.workers)
+        # gunicorn unavailable: the single-process lifespan registers below
     
-    # Setup cleanup on exit
-    def cleanup():
-        unregister_server(8069)
+    import uvicorn
+    app = _build_app()
     
-    atexit.register(cleanup)
-    
-    # Handle signals for graceful shutdown
-    def signal_handler(signum, frame):
-        print("\n\n🛑 Shutting down dashboard gracefully...")
-        unregister_server(8069)
-        sys.exit(0)
-    
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
+    # Own the event loop ourselves and run uvicorn.Server.serve() in it. Its
+    # own SIGINT/SIGTERM handlers shut the server down gracefully, so the
+    # lifespan handler is the single place the registry entry is added and
+    # removed.
+    config = uvicorn.Config(
+        app,
+        host="0.0.0.0",
+        port=8069,
+        reload=False,  # Disable reload for dashboard
+        log_level="info",
+        http="httptools"  # C HTTP parser (uvicorn[standard])
+    )
+    server = uvicorn.Server(config)
     
-    # Run the dashboard server
+    # Run the dashboard server. serve() never reads Config.loop; the loop is
+    # whatever runs it: uvloop (libuv-backed, uvicorn[standard]) if installed.
     try:
-        uvicorn.run(
-            app,
-            host="0.0.0.0",
-            port=8069,
-            reload=False,  # Disable reload for dashboard
-            log_level="info"
-        )
+        try:
+            import uvloop
+        except ImportError:
+            asyncio.run(server.serve())
+        else:
+            uvloop.run(server.serve())
     except KeyboardInterrupt:
         print("\n\n✓ Dashboard stopped")
-        cleanup()
     except Exception as e:
         print(f"\n❌ Dashboard error: {e}")
-        cleanup()
         sys.exit(1)
 
 
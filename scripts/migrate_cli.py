@@ -12,19 +12,37 @@ from pathlib import Path
 def setup_uv_environment():
     """Detect and setup uv environment if available."""
     try:
-        import subprocess
+        import shutil
         import os
-        # Check if uv is available
-        result = subprocess.run(['which', 'uv'], capture_output=True, text=True)
-        if result.returncode == 0:
-            # uv is available, check if we're already running under uv
-            # UV_RUN_RECURSION_DEPTH is set when running under uv
-            if 'UV_RUN_RECURSION_DEPTH' not in os.environ:
-                # We're not running under uv, restart with uv
-                print("🔄 Restarting with uv environment...")
-                env = os.environ.copy()
-                env['__UV_RESTARTED'] = '1'
-                os.execvpe('uv', ['uv', 'run', '--script', sys.argv[0]] + sys.argv[1:], env)
+        # Already restarted once, or already inside an activated venv: nothing to do
+        if os.environ.get('__UV_RESTARTED') or os.environ.get('VIRTUAL_ENV'):
+            return
+        # UV_RUN_RECURSION_DEPTH is set when running under uv
+        if 'UV_RUN_RECURSION_DEPTH' in os.environ:
+            return
+        # The CLI only needs src.migrations/src.db/src.version; if those already
+        # import in this interpreter there is nothing to gain from uv
+        repo_root = str(Path(__file__).parent.parent)
+        if repo_root not in sys.path:
+            sys.path.insert(0, repo_root)
+        try:
+            import src.migrations, src.db, src.version  # noqa: F401
+            return
+        except ModuleNotFoundError:
+            pass
+        # Prefer activating the project's existing .venv in-process over
+        # re-launching the interpreter under `uv run`
+        from src.venv_setup import activate_venv
+        venv = Path(__file__).parent.parent / '.venv'
+        if activate_venv(venv):
+            return
+        # Check if uv is available (PATH lookup, no subprocess)
+        if shutil.which('uv'):
+            # We're not running under uv, restart with uv
+            print("🔄 Restarting with uv environment...")
+            env = os.environ.copy()
+            env['__UV_RESTARTED'] = '1'
+            os.execvpe('uv', ['uv', 'run', '--script', sys.argv[0]] + sys.argv[1:], env)
     except Exception:
         # If anything fails, just continue with current environment
         pass
@@ -101,8 +119,9 @@ def cmd_info(args):
         print("Schema Changelog:")
         print("-" * 60)
         
-        for version in sorted(get_changelog().keys()):
-            changelog = get_changelog(version)
+        changelog_all = get_changelog()
+        for version in sorted(changelog_all):
+            changelog = changelog_all[version]
             print(f"\nv{version} - {changelog['version']} ({changelog['date']})")
             print(f"  {changelog['description']}")
             print("  Changes:")
@@ -2,20 +2,70 @@
 """
 Manual sanity-check for MCP bulk tools: create_todos / update_todos.
 
-This uses a temporary SQLite DB file so it won't touch any project database.
+This uses temporary SQLite DB files so it won't touch any project database.
+Each bulk tool is called once for the whole batch and timed, so larger
+--count values double as a micro-benchmark of the bulk path (a per-row
+regression shows up as per-todo time growing with the batch size).
 Run:
   python3 scripts/test_bulk_mcp_tools.py
+  python3 scripts/test_bulk_mcp_tools.py --count 10 100 1000 10000
 """
 
+import argparse
 import asyncio
 import json
 import os
 import sys
 import tempfile
+import time
 from pathlib import Path
 
 
-async def main() -> None:
+async def run_batch(call_tool, db_path: str, count: int) -> tuple[float, float]:
+    """Create then update `count` todos in `db_path`; return (create_secs, update_secs)."""
+    # Bulk create (one tool call for the whole batch)
+    t0 = time.perf_counter()
+    created = await call_tool(
+        "create_todos_batch",
+        {
+            "db_path": db_path,
+            "todos": [
+                {"title": f"Bulk Tool Test {i + 1}", "description": "created via create_todos"}
+                for i in range(count)
+            ],
+        },
+    )
+    create_secs = time.perf_counter() - t0
+    payload = json.loads(created[0].text)
+    assert payload["created_count"] == count, payload
+    ids = [t["id"] for t in payload["todos"]]
+
+    # Bulk update (one tool call for the whole batch)
+    t0 = time.perf_counter()
+    updated = await call_tool(
+        "update_todos_batch",
+        {"db_path": db_path, "todos": [{"todo_id": todo_id, "status": "completed"} for todo_id in ids]},
+    )
+    update_secs = time.perf_counter() - t0
+    payload2 = json.loads(updated[0].text)
+    assert payload2["updated_count"] == count, payload2
+    assert all(t["status"] == "completed" for t in payload2["todos"]), payload2
+
+    # Independent follow-up reads
+    fetched, listed = await asyncio.gather(
+        call_tool("get_todos_batch", {"db_path": db_path, "todo_ids": ids}),
+        call_tool("list_todos", {"db_path": db_path}),
+    )
+    payload3 = json.loads(fetched[0].text)
+    assert payload3["found_count"] == count, payload3
+    assert all(t["status"] == "completed" for t in payload3["todos"]), payload3
+    payload4 = json.loads(listed[0].text)
+    assert payload4["total_count"] == count, payload4
+
+    return create_secs, update_secs
+
+
+async def main(counts: list[int]) -> None:
     # Ensure repository root is on sys.path so `import src...` works when run as a script
     repo_root = Path(__file__).resolve().parent.parent
     sys.path.insert(0, str(repo_root))
@@ -30,33 +80,29 @@ async def main() -> None:
 
         init_db()
 
-        # Bulk create
-        created = await call_tool(
-            "create_todos_batch",
-            {
-                "todos": [
-                    {"title": "Bulk Tool Test 1", "description": "created via create_todos"},
-                    {"title": "Bulk Tool Test 2", "description": "created via create_todos"},
-                ]
-            },
-        )
-        payload = json.loads(created[0].text)
-        assert payload["created_count"] == 2, payload
-        ids = [t["id"] for t in payload["todos"]]
-
-        # Bulk update
-        updated = await call_tool(
-            "update_todos_batch",
-            {"todos": [{"todo_id": ids[0], "status": "completed"}, {"todo_id": ids[1], "status": "completed"}]},
-        )
-        payload2 = json.loads(updated[0].text)
-        assert payload2["updated_count"] == 2, payload2
-        assert all(t["status"] == "completed" for t in payload2["todos"]), payload2
+        # Each batch size gets its own fresh DB so the timings are comparable.
+        print(f"{'count':>8}  {'create (s)':>10}  {'update (s)':>10}  {'create/todo (ms)':>16}  {'update/todo (ms)':>16}")
+        for count in counts:
+            batch_db = str(Path(d) / f"project-{count}.db")
+            create_secs, update_secs = await run_batch(call_tool, batch_db, count)
+            print(
+                f"{count:>8}  {create_secs:>10.3f}  {update_secs:>10.3f}  "
+                f"{create_secs * 1000 / count:>16.3f}  {update_secs * 1000 / count:>16.3f}"
+            )
 
         print("✅ Bulk MCP tools OK")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
-
-
+    parser = argparse.ArgumentParser(description="Sanity-check the MCP bulk tools")
+    parser.add_argument(
+        "--count",
+        type=int,
+        nargs="+",
+        default=[2],
+        help="Batch size(s) to run, each against a fresh DB (default: 2)",
+    )
+    args = parser.parse_args()
+    if any(c < 1 for c in args.count):
+        parser.error("--count values must be >= 1")
+    asyncio.run(main(args.count))
@@ -3,11 +3,13 @@ CRUD (Create, Read, Update, Delete) operations for the database.
 These functions are used by both the MCP server and web server.
 """
 
-from typing import List, Optional
-import json
+from typing import Dict, List, Optional, Tuple
+import time
+import orjson
 from datetime import datetime
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import or_, and_, func
+from sqlalchemy.orm import Session, joinedload, selectinload, load_only, aliased, make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy import or_, and_, func, insert, exists, select, update, case, lambda_stmt, union_all, delete, event
 from .db import (
     Todo,
     Note,
@@ -15,10 +17,11 @@ from .db import (
     TodoStatus,
     TodoCategory,
     Tag,
-    TodoTag,
+    todo_tags,
     NoteType,
     TodoRelation,
     TodoAttachment,
+    expire_todo_collection,
 )
 from .schemas import TodoCreate, TodoUpdate, NoteCreate, NoteUpdate, TodoSearch
 
@@ -30,62 +33,199 @@ from .schemas import TodoCreate, TodoUpdate, NoteCreate, NoteUpdate, TodoSearch
 # -----------------------------------------------------------------------------
 
 QUEUE_RELEVANT_STATUSES = {TodoStatus.PENDING, TodoStatus.IN_PROGRESS}
+# Fixed-order form for SQL `IN (...)`: iterating the set gives no stable
+# ordering, and a tuple avoids building a fresh list on every query.
+QUEUE_RELEVANT_STATUS_TUPLE = (TodoStatus.PENDING, TodoStatus.IN_PROGRESS)
 
 
 def _is_queue_relevant(status: Optional[TodoStatus]) -> bool:
     """Queue only applies to active work (pending/in_progress)."""
-    return status in QUEUE_RELEVANT_STATUSES
+    return status is TodoStatus.PENDING or status is TodoStatus.IN_PROGRESS
+
+
+# -----------------------------------------------------------------------------
+# Tag/topic list cache
+# -----------------------------------------------------------------------------
+
+# get_all_tags/get_all_topics feed every sidebar and filter dropdown and
+# rarely change. Results are kept per database for a few seconds; writes made
+# through this module invalidate them immediately, writes from other processes
+# become visible once the TTL lapses.
+LOOKUP_CACHE_TTL = 5.0
+_lookup_cache: Dict[Tuple[str, str], Tuple[float, list]] = {}
+
+
+def _lookup_cache_key(db: Session, kind: str) -> Tuple[str, str]:
+    return (str(db.get_bind().url), kind)
+
+
+def _lookup_cache_get(db: Session, kind: str) -> Optional[list]:
+    entry = _lookup_cache.get(_lookup_cache_key(db, kind))
+    if entry is None or time.monotonic() - entry[0] >= LOOKUP_CACHE_TTL:
+        return None
+    return list(entry[1])
+
+
+def _lookup_cache_put(db: Session, kind: str, value: list) -> None:
+    _lookup_cache[_lookup_cache_key(db, kind)] = (time.monotonic(), value)
+
+
+def _invalidate_lookup_cache(db: Session, *kinds: str) -> None:
+    """Drop cached lookups. Call after commit, or a reader could re-cache the old rows."""
+    for kind in kinds:
+        _lookup_cache.pop(_lookup_cache_key(db, kind), None)
+
+
+# Session.info key for lookup kinds to invalidate once the transaction commits
+_PENDING_INVALIDATION_KEY = "lookup_cache_invalidations"
+
+
+def _invalidate_lookup_cache_on_commit(db: Session, *kinds: str) -> None:
+    """For helpers that write but leave committing to their caller."""
+    db.info.setdefault(_PENDING_INVALIDATION_KEY, set()).update(kinds)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_pending_invalidations(session):
+    _invalidate_lookup_cache(session, *session.info.pop(_PENDING_INVALIDATION_KEY, ()))
+
+
+# Session.info key for the per-transaction tag name -> id map (see _get_or_create_tags)
+_TAG_ID_CACHE_KEY = "tag_ids"
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _drop_tag_id_cache(session, transaction):
+    # Commit, rollback and close all end up here. Once the transaction is
+    # over, another session may delete a tag (or a rollback may undo one we
+    # inserted), and a stale id would leave a dangling todo_tags row.
+    session.info.pop(_TAG_ID_CACHE_KEY, None)
+
+
+def _tag_ref(db: Session, tag_id: int) -> Tag:
+    """
+    Session-bound Tag for a known id, without a SELECT: returns the instance
+    already in the identity map (even if expired) or attaches a stub by PK.
+    Enough for appending to Todo.tags; other attributes load on access.
+    """
+    stub = Tag(id=tag_id)
+    make_transient_to_detached(stub)
+    return db.merge(stub, load=False)
+
+
+def _get_or_create_tags(db: Session, tag_names: List[str]) -> List[Tag]:
+    """
+    Resolve tag names to Tag rows, creating any that don't exist yet.
+    Names already resolved in this transaction come from a name -> id map kept
+    in `db.info`, so a batch of todos sharing a few tags looks each one up once;
+    the rest take one SELECT, plus one bulk INSERT + SELECT for new tags.
+    Returned in input order, de-duplicated.
+    """
+    names = list(dict.fromkeys(tag_names))
+    if not names:
+        return []
+    tag_ids: Dict[str, int] = db.info.setdefault(_TAG_ID_CACHE_KEY, {})
+    missing = [n for n in names if n not in tag_ids]
+    if missing:
+        for tag_id, name in db.query(Tag.id, Tag.name).filter(Tag.name.in_(missing)).all():
+            tag_ids[name] = tag_id
+        new = [n for n in missing if n not in tag_ids]
+        if new:
+            # OR IGNORE: another session may have created the same tag since
+            # the SELECT above; the re-select below picks up its id either way.
+            db.execute(insert(Tag).prefix_with("OR IGNORE", dialect="sqlite"), [{"name": n} for n in new])
+            _invalidate_lookup_cache_on_commit(db, "tags")
+            for tag_id, name in db.query(Tag.id, Tag.name).filter(Tag.name.in_(new)).all():
+                tag_ids[name] = tag_id
+    return [_tag_ref(db, tag_ids[n]) for n in names]
 
 def get_todo(db: Session, todo_id: int) -> Optional[Todo]:
     """Get a single todo by ID with all relationships loaded."""
+    # selectinload: one `WHERE todo_id IN (...)` query per collection instead
+    # of a five-way JOIN whose row count is the product of the collection sizes.
+    # relations/attachments stay lazy: the detail views read them through
+    # get_relates_to_ids()/get_todo_attachments(), never via the todo.
+    # Children get their tags/notes too: the MCP detail serializes them.
     return db.query(Todo).options(
-        joinedload(Todo.children),
-        joinedload(Todo.notes),
-        joinedload(Todo.dependencies),
-        joinedload(Todo.relations),
-        joinedload(Todo.attachments),
+        selectinload(Todo.children).selectinload(Todo.tags),
+        selectinload(Todo.children).selectinload(Todo.notes),
+        selectinload(Todo.notes),
+        selectinload(Todo.dependencies),
+        selectinload(Todo.tags),
     ).filter(Todo.id == todo_id).first()
 
 
+def _get_todo_bare(db: Session, todo_id: int) -> Optional[Todo]:
+    """
+    Get a single todo by primary key without eager-loading relationships.
+    For mutators that only read/write scalar columns (queue, status). An
+    instance already in the identity map is returned as-is, without SQL.
+    """
+    return db.get(Todo, todo_id)
+
+
 def get_todos(db: Session, skip: int = 0, limit: int = 100) -> List[Todo]:
     """Get all todos with pagination."""
     return db.query(Todo).offset(skip).limit(limit).all()
 
 
+def get_todos_after(db: Session, last_id: Optional[int] = None, limit: int = 100) -> List[Todo]:
+    """
+    Keyset pagination: the next `limit` todos with id > last_id, ordered by id.
+    Pass the last id of the previous page to continue; unlike OFFSET, the cost
+    doesn't grow with how deep into the list the page is.
+    """
+    return db.query(Todo).filter(Todo.id > (last_id or 0)).order_by(Todo.id).limit(limit).all()
+
+
 def get_root_todos(db: Session) -> List[Todo]:
     """Get all top-level todos (no parent)."""
-    return db.query(Todo).filter(Todo.parent_id == None).all()
+    return db.query(Todo).filter(Todo.parent_id == None).order_by(Todo.id).all()
 
 
-def get_todo_tree(db: Session) -> List[Todo]:
+def _load_subtrees(db: Session, anchor) -> List[Todo]:
     """
-    Get hierarchical todo tree (root todos with all children loaded).
-    Uses recursive loading through relationships.
+    Load the todos matching `anchor` and all of their descendants, ordered by id.
+    One recursive CTE collects the ids and one SELECT loads the rows, and each
+    node's `children` is wired up from that result, so walking the trees never
+    lazy-loads. Tags and notes, which the tree serializers/exports read, come
+    in by selectinload.
     """
-    def _as_children_list(children_value):
-        """
-        Normalize `Todo.children` to a list.
-        Defensive: misconfigured ORM relationships or older mappings can yield
-        `None` (no children) or a scalar Todo (single child).
-        """
-        if children_value is None:
-            return []
-        # SQLAlchemy's InstrumentedList is list-like; keep it as-is.
-        if isinstance(children_value, (list, tuple)):
-            return list(children_value)
-        # Scalar relationship (unexpected) — wrap.
-        return [children_value]
-
-    def load_children(todo: Todo):
-        """Recursively load children."""
-        for child in _as_children_list(getattr(todo, "children", None)):
-            load_children(child)
-        return todo
-    
-    root_todos = get_root_todos(db)
-    if root_todos is None:
-        return []
-    return [load_children(todo) for todo in root_todos]
+    tree = (
+        select(Todo.id.label("id"))
+        .where(anchor)
+        .cte("tree", recursive=True)
+    )
+    tree = tree.union_all(select(Todo.id).join(tree, Todo.parent_id == tree.c.id))
+    todos = (
+        db.query(Todo)
+        .options(selectinload(Todo.tags), selectinload(Todo.notes))
+        .join(tree, Todo.id == tree.c.id)
+        .order_by(Todo.id)
+        .all()
+    )
+
+    children_by_parent: dict[int, list[Todo]] = {}
+    for todo in todos:
+        children_by_parent.setdefault(todo.parent_id, []).append(todo)
+    for todo in todos:
+        set_committed_value(todo, "children", children_by_parent.get(todo.id, []))
+    return todos
+
+
+def get_todo_tree(db: Session) -> List[Todo]:
+    """Get hierarchical todo tree (root todos with all children loaded)."""
+    return [todo for todo in _load_subtrees(db, Todo.parent_id == None) if todo.parent_id is None]
+
+
+def get_todo_subtree(db: Session, todo_id: int) -> Optional[Todo]:
+    """Get a todo with all of its descendants loaded, like get_todo_tree."""
+    return next((todo for todo in _load_subtrees(db, Todo.id == todo_id) if todo.id == todo_id), None)
+
+
+def _dumps_ai_instructions(ai_instr) -> str:
+    """Serialize ai_instructions for the TEXT column (orjson; non-str keys allowed like json.dumps)."""
+    return orjson.dumps(ai_instr, option=orjson.OPT_NON_STR_KEYS).decode()
 
 
 def create_todo(db: Session, todo: TodoCreate) -> Todo:
@@ -99,7 +239,7 @@ def create_todo(db: Session, todo: TodoCreate) -> Todo:
         ai_instr_json = "{}"
     else:
         try:
-            ai_instr_json = json.dumps(ai_instr)
+            ai_instr_json = _dumps_ai_instructions(ai_instr)
         except Exception:
             # Be defensive: fall back to empty.
             ai_instr_json = "{}"
@@ -122,27 +262,25 @@ def create_todo(db: Session, todo: TodoCreate) -> Todo:
         ai_instructions=ai_instr_json,
     )
     db.add(db_todo)
-    db.flush()  # Get the ID before adding tags
     
-    # Add tags if provided
+    # Add tags if provided (creating any that don't exist yet). No flush is
+    # needed first: the todo row and its todo_tags rows are written together
+    # by the single flush in commit().
     if todo.tag_names:
-        for tag_name in todo.tag_names:
-            tag = db.query(Tag).filter(Tag.name == tag_name).first()
-            if not tag:
-                # Create new tag if it doesn't exist
-                tag = Tag(name=tag_name)
-                db.add(tag)
-                db.flush()
-            db_todo.tags.append(tag)
+        db_todo.tags.extend(_get_or_create_tags(db, todo.tag_names))
     
     db.commit()
+    if db_todo.topic:
+        _invalidate_lookup_cache(db, "topics")
     db.refresh(db_todo)
     return db_todo
 
 
 def update_todo(db: Session, todo_id: int, todo_update: TodoUpdate) -> Optional[Todo]:
     """Update an existing todo with optional tags."""
-    db_todo = get_todo(db, todo_id)
+    # Plain PK lookup (identity-map hit when the caller already loaded it);
+    # relationships the caller reads afterwards load on access.
+    db_todo = _get_todo_bare(db, todo_id)
     if not db_todo:
         return None
     
@@ -161,11 +299,11 @@ def update_todo(db: Session, todo_id: int, todo_update: TodoUpdate) -> Optional[
         if ai_instr is None:
             update_data["ai_instructions"] = "{}"
         else:
-            update_data["ai_instructions"] = json.dumps(ai_instr)
+            update_data["ai_instructions"] = _dumps_ai_instructions(ai_instr)
     
     # Handle tags separately
     tag_names = update_data.pop('tag_names', None)
-    
+
     # Update regular fields
     for field, value in update_data.items():
         setattr(db_todo, field, value)
@@ -177,25 +315,32 @@ def update_todo(db: Session, todo_id: int, todo_update: TodoUpdate) -> Optional[
             db_todo.queue = 0
             queue_cleared = True
     
+    new_queue = int(getattr(db_todo, "queue", 0) or 0)
+    now_completed = db_todo.status == TodoStatus.COMPLETED
+
     # Update tags if provided
     if tag_names is not None:
-        # Clear existing tags
-        db_todo.tags.clear()
-        # Add new tags
-        for tag_name in tag_names:
-            tag = db.query(Tag).filter(Tag.name == tag_name).first()
-            if not tag:
-                tag = Tag(name=tag_name)
-                db.add(tag)
-                db.flush()
-            db_todo.tags.append(tag)
+        # Assign rather than clear() + extend(): a bulk replace only fires
+        # events for tags actually added or removed. Removing and re-appending
+        # a kept tag leaves a pending append on the Tag.todos side, which
+        # flushes as a duplicate todo_tags row.
+        db_todo.tags = _get_or_create_tags(db, tag_names)
     
     db.commit()
+    if "topic" in update_data:
+        _invalidate_lookup_cache(db, "topics")
     
     # If parent todo is being marked as completed, automatically mark all subtasks as completed
-    if status_being_completed and db_todo.status == TodoStatus.COMPLETED:
-        # Get all children (subtasks) of this todo
-        children = db.query(Todo).filter(Todo.parent_id == todo_id).all()
+    if status_being_completed and now_completed:
+        # Get all children (subtasks) of this todo. Only status/queue are
+        # touched, so skip the other columns (legacy progress_summary /
+        # remaining_work included).
+        children = (
+            db.query(Todo)
+            .options(load_only(Todo.status, Todo.queue))
+            .filter(Todo.parent_id == todo_id)
+            .all()
+        )
         for child in children:
             if child.status != TodoStatus.COMPLETED:
                 child.status = TodoStatus.COMPLETED
@@ -205,114 +350,170 @@ def update_todo(db: Session, todo_id: int, todo_update: TodoUpdate) -> Optional[
             db.commit()
 
     # If this update removed an item from the queue (including status changes),
-    # normalize queue positions so they stay contiguous.
-    if queue_cleared or (prev_queue > 0 and int(getattr(db_todo, "queue", 0) or 0) == 0):
+    # normalize queue positions so they stay contiguous. The queue delta is
+    # computed from in-memory values captured before commit, so unchanged
+    # queues skip the renumbering entirely.
+    if queue_cleared or (prev_queue > 0 and new_queue == 0):
         normalize_queue(db)
 
-    db.refresh(db_todo)
+    # No refresh: sessions keep state across commit (expire_on_commit=False),
+    # updated_at is stamped in Python, and the queue UPDATEs synchronize the
+    # identity map, so db_todo already holds what was written.
     return db_todo
 
 
 def delete_todo(db: Session, todo_id: int) -> bool:
     """Delete a todo (cascades to children and notes)."""
-    db_todo = get_todo(db, todo_id)
+    db_todo = _get_todo_bare(db, todo_id)
     if not db_todo:
         return False
     
     db.delete(db_todo)
     db.commit()
+    # The deleted subtree may have held the last use of a topic
+    _invalidate_lookup_cache(db, "topics")
     return True
 
 
+def _is_sqlite(db: Session) -> bool:
+    return db.get_bind().dialect.name == "sqlite"
+
+
+def _ci_like(column, pattern, ilike: bool):
+    """
+    Case-insensitive LIKE that stays sargable on the active backend.
+    SQLite's LIKE is already case-insensitive (and its lower() is ASCII-only),
+    so `ilike`'s lower(col) LIKE lower(:p) just adds per-row lower() calls and
+    keeps the planner from using an index; emit plain LIKE there.
+    """
+    return column.ilike(pattern) if ilike else column.like(pattern)
+
+
+def _deep_search_match(search_term, ilike: bool):
+    """
+    Todo.id IN (UNION ALL of per-column matches): todo text fields, notes
+    content and tag names. Each branch is a simple single-column predicate the
+    planner can serve from its own index; IN makes duplicates harmless, so no
+    DISTINCT/sort-unique is needed.
+    """
+    text_columns = (
+        Todo.title,
+        Todo.description,
+        Todo.progress_summary,
+        Todo.remaining_work,
+        Todo.work_completed,
+        Todo.work_remaining,
+        Todo.implementation_issues,
+        Todo.topic,
+    )
+    branches = [select(Todo.id).where(_ci_like(col, search_term, ilike)) for col in text_columns]
+    branches.append(select(Note.todo_id).where(_ci_like(Note.content, search_term, ilike)))
+    branches.append(
+        select(todo_tags.c.todo_id)
+        .join(Tag, Tag.id == todo_tags.c.tag_id)
+        .where(_ci_like(Tag.name, search_term, ilike))
+    )
+    return Todo.id.in_(union_all(*branches))
+
+
+# Target of a dependency edge, for search_todos' readiness filter
+_DependsOn = aliased(Todo)
+
+
 def search_todos(db: Session, search: TodoSearch) -> List[Todo]:
     """
     Search/filter todos based on query, category, status, parent_id, topic, and tags.
     Deep search includes title, description, progress fields, notes content, and tag names.
+
+    Built from lambda statements: each `stmt += lambda ...` step is keyed by its
+    code location, so the SQL for a given combination of filters is compiled
+    once and later calls only re-bind parameter values.
     """
-    query = db.query(Todo)
+    # Results are serialized with their tag names.
+    stmt = lambda_stmt(lambda: select(Todo).options(selectinload(Todo.tags)))
+    sqlite = _is_sqlite(db)
     
     if search.query:
         search_term = f"%{search.query}%"
         # Deep search: include notes content and tag names
-        # Use subqueries to avoid complex joins that might cause duplicates
-        from sqlalchemy import exists
-        notes_match = exists().where(
-            and_(Note.todo_id == Todo.id, Note.content.ilike(search_term))
-        )
-        tags_match = exists().where(
-            and_(
-                TodoTag.todo_id == Todo.id,
-                TodoTag.tag_id == Tag.id,
-                Tag.name.ilike(search_term)
-            )
-        )
-        query = query.filter(
-            or_(
-                Todo.title.ilike(search_term),
-                Todo.description.ilike(search_term),
-                Todo.progress_summary.ilike(search_term),
-                Todo.remaining_work.ilike(search_term),
-                Todo.work_completed.ilike(search_term),
-                Todo.work_remaining.ilike(search_term),
-                Todo.implementation_issues.ilike(search_term),
-                Todo.topic.ilike(search_term),
-                notes_match,
-                tags_match,
-            )
-        ).distinct()  # Use distinct to avoid duplicates from subqueries
+        if sqlite:
+            stmt += lambda s: s.where(_deep_search_match(search_term, False))
+        else:
+            stmt += lambda s: s.where(_deep_search_match(search_term, True))
     
     if search.category:
-        query = query.filter(Todo.category == search.category)
+        category = search.category
+        stmt += lambda s: s.where(Todo.category == category)
     
     if search.status:
-        query = query.filter(Todo.status == search.status)
+        status = search.status
+        stmt += lambda s: s.where(Todo.status == status)
     
     if search.parent_id is not None:
-        query = query.filter(Todo.parent_id == search.parent_id)
+        parent_id = search.parent_id
+        stmt += lambda s: s.where(Todo.parent_id == parent_id)
     
     if search.topic:
-        topic_term = f"%{search.topic}%"
-        query = query.filter(Todo.topic.ilike(topic_term))
+        # Case-insensitive prefix match, so it can be served from an index:
+        # SQLite's LIKE uses ix_todos_topic_nocase; elsewhere lower(topic)
+        # LIKE lower(:p) can use an index on lower(topic).
+        topic_prefix = f"{search.topic}%"
+        if sqlite:
+            stmt += lambda s: s.where(Todo.topic.like(topic_prefix))
+        else:
+            stmt += lambda s: s.where(func.lower(Todo.topic).like(func.lower(topic_prefix)))
     
     if search.tags:
-        # Filter by tags (todos that have ALL specified tags)
-        for tag_name in search.tags:
-            query = query.join(Todo.tags).filter(Tag.name == tag_name)
+        # Filter by tags (todos that have ALL specified tags): one correlated
+        # count instead of a join per tag, so the statement shape doesn't
+        # depend on how many tags were given.
+        tag_names = list(dict.fromkeys(search.tags))
+        tag_count = len(tag_names)
+        stmt += lambda s: s.where(
+            select(func.count(func.distinct(todo_tags.c.tag_id)))
+            .join(Tag, Tag.id == todo_tags.c.tag_id)
+            .where(todo_tags.c.todo_id == Todo.id, Tag.name.in_(tag_names))
+            .scalar_subquery()
+            == tag_count
+        )
 
     # Execution & priority filters
     if getattr(search, "in_queue", None) is True:
-        query = query.filter(Todo.queue > 0, Todo.status.in_(list(QUEUE_RELEVANT_STATUSES)))
+        stmt += lambda s: s.where(Todo.queue > 0, Todo.status.in_(QUEUE_RELEVANT_STATUS_TUPLE))
     elif getattr(search, "in_queue", None) is False:
-        query = query.filter(Todo.queue == 0)
+        stmt += lambda s: s.where(Todo.queue == 0)
 
     if getattr(search, "queue", None) is not None:
-        query = query.filter(Todo.queue == search.queue, Todo.status.in_(list(QUEUE_RELEVANT_STATUSES)))
+        queue = search.queue
+        stmt += lambda s: s.where(Todo.queue == queue, Todo.status.in_(QUEUE_RELEVANT_STATUS_TUPLE))
 
     if getattr(search, "task_size", None) is not None:
-        query = query.filter(Todo.task_size == search.task_size)
+        task_size = search.task_size
+        stmt += lambda s: s.where(Todo.task_size == task_size)
 
     if getattr(search, "priority_class", None):
-        query = query.filter(Todo.priority_class == search.priority_class)
+        priority_class = search.priority_class
+        stmt += lambda s: s.where(Todo.priority_class == priority_class)
 
     # Dependency readiness filters
     dep_status = getattr(search, "dependency_status", None)
-    if dep_status and dep_status != "any":
-        from sqlalchemy import exists
-        from sqlalchemy.orm import aliased
-        DependsOn = aliased(Todo)
-        unmet_dep_exists = exists().where(
-            and_(
-                TodoDependency.todo_id == Todo.id,
-                TodoDependency.depends_on_id == DependsOn.id,
-                DependsOn.status != TodoStatus.COMPLETED,
-            )
-        )
-        if dep_status == "ready":
-            query = query.filter(~unmet_dep_exists)
-        elif dep_status == "blocked":
-            query = query.filter(unmet_dep_exists)
+    if dep_status == "ready":
+        stmt += lambda s: s.where(~_unmet_dependency_exists())
+    elif dep_status == "blocked":
+        stmt += lambda s: s.where(_unmet_dependency_exists())
     
-    return query.all()
+    return list(db.execute(stmt).scalars().all())
+
+
+def _unmet_dependency_exists():
+    """EXISTS: the outer todo depends on a todo that isn't completed yet."""
+    return exists().where(
+        and_(
+            TodoDependency.todo_id == Todo.id,
+            TodoDependency.depends_on_id == _DependsOn.id,
+            _DependsOn.status != TodoStatus.COMPLETED,
+        )
+    )
 
 
 # -----------------------------------------------------------------------------
@@ -337,7 +538,8 @@ def get_queued_todos(db: Session, limit: Optional[int] = None, min_size: Optiona
     """
     q = (
         db.query(Todo)
-        .filter(Todo.queue > 0, Todo.status.in_(list(QUEUE_RELEVANT_STATUSES)))
+        .options(selectinload(Todo.tags))  # serialized with their tag names
+        .filter(Todo.queue > 0, Todo.status.in_(QUEUE_RELEVANT_STATUS_TUPLE))
         .order_by(Todo.queue.asc(), Todo.id.asc())
     )
     
@@ -359,7 +561,7 @@ def get_max_queue(db: Session) -> int:
     """Get the current maximum queue value (0 if none)."""
     max_val = (
         db.query(func.max(Todo.queue))
-        .filter(Todo.queue > 0, Todo.status.in_(list(QUEUE_RELEVANT_STATUSES)))
+        .filter(Todo.queue > 0, Todo.status.in_(QUEUE_RELEVANT_STATUS_TUPLE))
         .scalar()
     )
     return int(max_val or 0)
@@ -370,42 +572,65 @@ def normalize_queue(db: Session) -> None:
     Normalize queue values to be contiguous starting at 1, in current queue order.
     Leaves non-queued items at 0.
     """
-    queued = get_queued_todos(db)
-    expected = 1
-    changed = False
-    for todo in queued:
-        if todo.queue != expected:
-            todo.queue = expected
-            changed = True
-        expected += 1
-    if changed:
-        db.commit()
+    # One set-based UPDATE ... FROM (row_number() OVER ...) instead of loading
+    # every queued todo; supported by both PostgreSQL and SQLite >= 3.33.
+    ranked = (
+        select(
+            Todo.id.label("id"),
+            func.row_number().over(order_by=(Todo.queue.asc(), Todo.id.asc())).label("rn"),
+        )
+        .where(Todo.queue > 0, Todo.status.in_(QUEUE_RELEVANT_STATUS_TUPLE))
+        .subquery("ranked")
+    )
+    db.execute(
+        update(Todo)
+        .where(Todo.id == ranked.c.id, Todo.queue != ranked.c.rn)
+        .values(queue=ranked.c.rn)
+        .execution_options(synchronize_session="fetch")
+    )
+    # Commit even when nothing moved: the UPDATE opened a write transaction.
+    db.commit()
 
 
 def add_to_queue(db: Session, todo_id: int) -> Optional[Todo]:
     """Add a todo to the end of the queue (sets queue to max+1)."""
-    todo = get_todo(db, todo_id)
-    if not todo:
-        return None
+    # Atomic append: compute max+1 inside the UPDATE itself so concurrent adds
+    # can't read the same max and land on the same position.
+    Queued = aliased(Todo)
+    next_pos = (
+        select(func.coalesce(func.max(Queued.queue) + 1, 1))
+        .where(Queued.queue > 0, Queued.status.in_(QUEUE_RELEVANT_STATUS_TUPLE))
+        .scalar_subquery()
+    )
+    result = db.execute(
+        update(Todo)
+        .where(
+            Todo.id == todo_id,
+            or_(Todo.queue == 0, Todo.queue.is_(None)),
+            Todo.status.in_(QUEUE_RELEVANT_STATUS_TUPLE),
+        )
+        .values(queue=next_pos)
+        .execution_options(synchronize_session="fetch")
+    )
+    db.commit()
+    todo = _get_todo_bare(db, todo_id)
+    if not todo or result.rowcount:
+        return todo
     # Queue only applies to active work.
     if not _is_queue_relevant(getattr(todo, "status", None)):
         if int(getattr(todo, "queue", 0) or 0) != 0:
             todo.queue = 0
             db.commit()
             normalize_queue(db)
-            db.refresh(todo)
-        return todo
-    if (todo.queue or 0) > 0:
+            todo = _get_todo_bare(db, todo_id)
         return todo
-    todo.queue = get_max_queue(db) + 1
-    db.commit()
-    db.refresh(todo)
+    # Already queued
     return todo
 
 
 def remove_from_queue(db: Session, todo_id: int) -> Optional[Todo]:
     """Remove a todo from the queue (sets queue to 0) and normalizes queue."""
-    todo = get_todo(db, todo_id)
+    todo = _get_todo_bare(db, todo_id)
     if not todo:
         return None
     if (todo.queue or 0) == 0:
@@ -413,13 +638,24 @@ def remove_from_queue(db: Session, todo_id: int) -> Optional[Todo]:
     todo.queue = 0
     db.commit()
     normalize_queue(db)
-    db.refresh(todo)
+    todo = _get_todo_bare(db, todo_id)
     return todo
 
 
+def _swap_queue_positions(db: Session, a_id: int, a_queue: int, b_id: int, b_queue: int) -> None:
+    """Set todo a to a_queue and todo b to b_queue in one UPDATE ... CASE."""
+    db.execute(
+        update(Todo)
+        .where(Todo.id.in_([a_id, b_id]))
+        .values(queue=case({a_id: a_queue, b_id: b_queue}, value=Todo.id))
+        .execution_options(synchronize_session="fetch")
+    )
+    db.commit()
+
+
 def move_queue_up(db: Session, todo_id: int) -> Optional[Todo]:
     """Move a queued todo up by one position (swap with previous)."""
-    todo = get_todo(db, todo_id)
+    todo = _get_todo_bare(db, todo_id)
     if not todo or (todo.queue or 0) <= 1:
         return todo
     if not _is_queue_relevant(getattr(todo, "status", None)):
@@ -428,29 +664,28 @@ def move_queue_up(db: Session, todo_id: int) -> Optional[Todo]:
             todo.queue = 0
             db.commit()
             normalize_queue(db)
-            db.refresh(todo)
+            todo = _get_todo_bare(db, todo_id)
         return todo
     current_pos = int(todo.queue)
-    prev = (
-        db.query(Todo)
+    prev_id = (
+        db.query(Todo.id)
         .filter(
             Todo.queue == current_pos - 1,
-            Todo.status.in_(list(QUEUE_RELEVANT_STATUSES)),
+            Todo.status.in_(QUEUE_RELEVANT_STATUS_TUPLE),
         )
-        .first()
+        .limit(1)
+        .scalar()
     )
-    if not prev:
+    if prev_id is None:
         normalize_queue(db)
-        return get_todo(db, todo_id)
-    prev.queue, todo.queue = current_pos, current_pos - 1
-    db.commit()
-    db.refresh(todo)
-    return todo
+        return _get_todo_bare(db, todo_id)
+    _swap_queue_positions(db, todo_id, current_pos - 1, prev_id, current_pos)
+    return _get_todo_bare(db, todo_id)
 
 
 def move_queue_down(db: Session, todo_id: int) -> Optional[Todo]:
     """Move a queued todo down by one position (swap with next)."""
-    todo = get_todo(db, todo_id)
+    todo = _get_todo_bare(db, todo_id)
     if not todo or (todo.queue or 0) == 0:
         return todo
     if not _is_queue_relevant(getattr(todo, "status", None)):
@@ -458,25 +693,24 @@ def move_queue_down(db: Session, todo_id: int) -> Optional[Todo]:
         todo.queue = 0
         db.commit()
         normalize_queue(db)
-        db.refresh(todo)
+        todo = _get_todo_bare(db, todo_id)
         return todo
     current_pos = int(todo.queue)
-    next_todo = (
-        db.query(Todo)
+    next_id = (
+        db.query(Todo.id)
         .filter(
             Todo.queue == current_pos + 1,
-            Todo.status.in_(list(QUEUE_RELEVANT_STATUSES)),
+            Todo.status.in_(QUEUE_RELEVANT_STATUS_TUPLE),
         )
-        .first()
+        .limit(1)
+        .scalar()
     )
-    if not next_todo:
+    if next_id is None:
         # Might already be at bottom or queue is gapped
         normalize_queue(db)
-        return get_todo(db, todo_id)
-    next_todo.queue, todo.queue = current_pos, current_pos + 1
-    db.commit()
-    db.refresh(todo)
-    return todo
+        return _get_todo_bare(db, todo_id)
+    _swap_queue_positions(db, todo_id, current_pos + 1, next_id, current_pos)
+    return _get_todo_bare(db, todo_id)
 
 
 def add_concern(db: Session, parent_id: int, title: str, description: str) -> Optional[Todo]:
@@ -484,7 +718,7 @@ def add_concern(db: Session, parent_id: int, title: str, description: str) -> Op
     Convenience function to add a concern (a special type of todo).
     Prefixes the title with "[Concern]".
     """
-    parent = get_todo(db, parent_id)
+    parent = _get_todo_bare(db, parent_id)
     if not parent:
         return None
     
@@ -506,8 +740,22 @@ def add_concern(db: Session, parent_id: int, title: str, description: str) -> Op
 # Tag CRUD operations
 
 def get_all_tags(db: Session) -> List[Tag]:
-    """Get all tags, ordered by name."""
-    return db.query(Tag).order_by(Tag.name).all()
+    """
+    Get all tags, ordered by name.
+    Served from a short-TTL cache; the cached Tags are detached from any
+    session, so only their column attributes are available.
+    """
+    cached = _lookup_cache_get(db, "tags")
+    if cached is not None:
+        return cached
+    rows = db.query(Tag.id, Tag.name, Tag.description, Tag.created_at).order_by(Tag.name).all()
+    tags = []
+    for row in rows:
+        tag = Tag(id=row.id, name=row.name, description=row.description, created_at=row.created_at)
+        make_transient_to_detached(tag)
+        tags.append(tag)
+    _lookup_cache_put(db, "tags", tags)
+    return list(tags)
 
 
 def get_tag_by_name(db: Session, name: str) -> Optional[Tag]:
@@ -520,14 +768,26 @@ def create_tag(db: Session, name: str, description: Optional[str] = None) -> Tag
     tag = Tag(name=name, description=description)
     db.add(tag)
     db.commit()
+    _invalidate_lookup_cache(db, "tags")
     db.refresh(tag)
     return tag
 
 
 def get_all_topics(db: Session) -> List[str]:
-    """Get all unique topics used in todos."""
-    topics = db.query(Todo.topic).filter(Todo.topic.isnot(None)).distinct().all()
-    return sorted([t[0] for t in topics if t[0]])
+    """Get all unique topics used in todos (short-TTL cached, see get_all_tags)."""
+    cached = _lookup_cache_get(db, "topics")
+    if cached is not None:
+        return cached
+    rows = (
+        db.query(Todo.topic)
+        .filter(Todo.topic.isnot(None), Todo.topic != "")
+        .distinct()
+        .order_by(Todo.topic)
+        .all()
+    )
+    topics = [r[0] for r in rows]
+    _lookup_cache_put(db, "topics", topics)
+    return list(topics)
 
 
 # Note CRUD operations
@@ -617,21 +877,43 @@ def get_relates_to_ids(db: Session, todo_id: int) -> List[int]:
 def set_relates_to_ids(db: Session, todo_id: int, relates_to_ids: List[int]) -> None:
     """
     Replace relates_to links for a todo. Idempotent.
+    Only the difference against the stored links is written, so saving an
+    unchanged set issues no writes at all.
     """
-    db.query(TodoRelation).filter(TodoRelation.todo_id == todo_id).delete()
-    seen: set[int] = set()
+    todo_id = int(todo_id)
+    desired: set[int] = set()
     for rid in relates_to_ids or []:
         try:
             rid_int = int(rid)
         except Exception:
             continue
-        if rid_int == int(todo_id):
+        if rid_int == todo_id:
             continue
-        if rid_int in seen:
-            continue
-        seen.add(rid_int)
-        db.add(TodoRelation(todo_id=int(todo_id), relates_to_id=rid_int))
+        desired.add(rid_int)
+
+    existing = set(get_relates_to_ids(db, todo_id))
+    to_add = desired - existing
+    to_delete = existing - desired
+    if not to_add and not to_delete:
+        return
+
+    if to_delete:
+        db.execute(
+            delete(TodoRelation).where(
+                TodoRelation.todo_id == todo_id,
+                TodoRelation.relates_to_id.in_(to_delete),
+            )
+        )
+    if to_add:
+        db.execute(
+            insert(TodoRelation),
+            [{"todo_id": todo_id, "relates_to_id": rid} for rid in sorted(to_add)],
+        )
     db.commit()
+    # Core statements bypass the session; drop any loaded copies of the links.
+    expire_todo_collection(db, todo_id, "relations")
+    for rid in to_add | to_delete:
+        expire_todo_collection(db, rid, "related_from")
 
 
 def get_todo_attachments(db: Session, todo_id: int) -> List[TodoAttachment]:
@@ -687,8 +969,8 @@ def create_dependency(db: Session, todo_id: int, depends_on_id: int) -> Optional
         raise ValueError("A todo cannot depend on itself")
 
     # Check if both todos exist
-    todo = get_todo(db, todo_id)
-    depends_on = get_todo(db, depends_on_id)
+    todo = _get_todo_bare(db, todo_id)
+    depends_on = _get_todo_bare(db, depends_on_id)
     
     if not todo or not depends_on:
         return None
@@ -698,19 +980,18 @@ def create_dependency(db: Session, todo_id: int, depends_on_id: int) -> Optional
         """
         Returns True if there is already a dependency path start_id -> ... -> target_id.
         If so, adding target_id depends_on start_id would create a cycle.
+        Walks the graph in the database with one recursive CTE; UNION (not
+        UNION ALL) drops revisited nodes so pre-existing cycles still terminate.
         """
-        visited: set[int] = set()
-        stack: list[int] = [start_id]
-        while stack:
-            current = stack.pop()
-            if current == target_id:
-                return True
-            if current in visited:
-                continue
-            visited.add(current)
-            next_deps = db.query(TodoDependency.depends_on_id).filter(TodoDependency.todo_id == current).all()
-            stack.extend([row[0] for row in next_deps if row and row[0] is not None])
-        return False
+        reach = (
+            select(TodoDependency.depends_on_id.label("id"))
+            .where(TodoDependency.todo_id == start_id)
+            .cte("reach", recursive=True)
+        )
+        reach = reach.union(
+            select(TodoDependency.depends_on_id).join(reach, TodoDependency.todo_id == reach.c.id)
+        )
+        return bool(db.query(exists().select_from(reach).where(reach.c.id == target_id)).scalar())
 
     # We are adding: todo_id depends on depends_on_id
     # Cycle exists if depends_on_id already (directly/indirectly) depends on todo_id.
@@ -776,15 +1057,15 @@ def check_dependencies_met(db: Session, todo_id: int) -> bool:
     Check if all dependencies for a todo are completed.
     Returns True if all dependencies are met (or if there are no dependencies).
     """
-    dependencies = get_dependencies(db, todo_id)
-    
-    if not dependencies:
-        return True
-    
-    for dep in dependencies:
-        depends_on_todo = get_todo(db, dep.depends_on_id)
-        if depends_on_todo and depends_on_todo.status != TodoStatus.COMPLETED:
-            return False
-    
-    return True
+    # Single EXISTS probe instead of loading each dependency's todo
+    unmet = db.query(
+        exists().where(
+            and_(
+                TodoDependency.todo_id == todo_id,
+                TodoDependency.depends_on_id == Todo.id,
+                Todo.status != TodoStatus.COMPLETED,
+            )
+        )
+    ).scalar()
+    return not unmet
 
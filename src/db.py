@@ -6,29 +6,43 @@ Falls back to TODOTRACKER_DB_PATH environment variable if not found.
 """
 
 import os
+import threading
+import time
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Dict, Set
+from typing import Optional, Dict, List, Set
 from sqlalchemy import (
     create_engine,
+    inspect,
+    event,
+    func,
+    select,
     Column,
     Integer,
     String,
+    Table,
     Text,
     DateTime,
     ForeignKey,
+    Index,
+    CheckConstraint,
     Enum as SQLEnum,
 )
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, relationship, backref
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.orm import Session, declarative_base, sessionmaker, scoped_session, relationship
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.sql import text
 from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError
 import enum
 
 Base = declarative_base()
 
 _AUTO_MIGRATED_DB_PATHS: Set[str] = set()
+# Held while get_db() checks/migrates a path not yet in the set above, so
+# concurrent first requests don't each run the version check and migration.
+_AUTO_MIGRATE_LOCK = threading.Lock()
 
 
 class TodoCategory(str, enum.Enum):
@@ -73,7 +87,7 @@ class Todo(Base):
 
     # Execution & priority metadata
     # queue: 0 means not in queue; lower numbers execute first
-    queue = Column(Integer, nullable=False, default=0, index=True)
+    queue = Column(Integer, nullable=False, default=0)
     # task_size: optional 1-5 scale (effort/complexity)
     task_size = Column(Integer, nullable=True)
     # priority_class: optional A-E scale (importance)
@@ -97,11 +111,30 @@ class Todo(Base):
     remaining_work = Column(Text, nullable=True)
     
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    #
+    # New databases also get DEFAULT CURRENT_TIMESTAMP (UTC, like utcnow) so
+    # rows written outside the ORM are stamped by SQLite. The insert-side
+    # default still has to be sent (SQLite can't add a DEFAULT to an existing
+    # NOT NULL column). Rows written through Core executemany (tags,
+    # todo_tags, todo_relations) send CURRENT_TIMESTAMP inline instead of a
+    # Python datetime per row; ORM-inserted objects keep datetime.utcnow so
+    # the value is known (to the microsecond) without a RETURNING round trip.
+    created_at = Column(DateTime, default=datetime.utcnow, server_default=func.current_timestamp(), nullable=False)
+    updated_at = Column(
+        DateTime,
+        default=datetime.utcnow,
+        server_default=func.current_timestamp(),
+        onupdate=datetime.utcnow,
+        nullable=False,
+    )
     
     # Relationships
     #
+    # All collections load lazily by default. Queries whose results get
+    # serialized ask for what they read with selectinload() (see crud), so
+    # scalar-only paths (queue moves, stats) never pay for eager loads, and
+    # eager-loaded todos don't cascade into loading further todos.
+    #
     # Self-referential relationship:
     # - parent: scalar (many-to-one)
     # - children: list (one-to-many)
@@ -112,10 +145,13 @@ class Todo(Base):
     parent = relationship(
         "Todo",
         remote_side=[id],
-        backref=backref(
-            "children",
-            cascade="all, delete",  # Removed "orphan" - children become root todos when parent deleted
-        ),
+        back_populates="children",
+    )
+    children = relationship(
+        "Todo",
+        back_populates="parent",
+        cascade="all, delete",  # Removed "orphan" - children become root todos when parent deleted
+        order_by="Todo.id",
     )
     notes = relationship("Note", back_populates="todo", cascade="all, delete-orphan")
     
@@ -124,7 +160,7 @@ class Todo(Base):
         "TodoDependency",
         foreign_keys="TodoDependency.todo_id",
         back_populates="todo",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
     )
     
     # Tags (many-to-many)
@@ -147,6 +183,36 @@ class Todo(Base):
     # v6: File attachments
     attachments = relationship("TodoAttachment", back_populates="todo", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        # Topic search is a case-insensitive prefix LIKE; SQLite only serves
+        # that from an index declared with NOCASE collation.
+        Index("ix_todos_topic_nocase", topic.collate("NOCASE")).ddl_if(dialect="sqlite"),
+        # Queue scans (get_queued_todos, get_max_queue, neighbour lookups in
+        # move_queue_*) filter on queue > 0 plus status; only the handful of
+        # queued rows need to be in the index.
+        Index(
+            "ix_todos_queue_status",
+            queue,
+            status,
+            sqlite_where=queue > 0,
+        ),
+        # Exact-position lookups (queue == N AND status IN (...)) and
+        # status-filtered lists ordered by queue/priority. With the partial
+        # index above this replaces the old single-column queue index.
+        Index("ix_todos_status_queue_prio", status, queue, priority_class),
+        # Children of a todo, optionally filtered by status.
+        Index("ix_todos_parent_status", parent_id, status),
+        # SQLEnum persists member names ("PENDING", ...) without a CHECK of its
+        # own; validate them in the database as well (new databases only,
+        # SQLite can't add a constraint to an existing table).
+        CheckConstraint(
+            category.in_([c.name for c in TodoCategory]), name="ck_todo_category"
+        ),
+        CheckConstraint(
+            status.in_([s.name for s in TodoStatus]), name="ck_todo_status"
+        ),
+    )
+
 
 class Note(Base):
     """
@@ -159,17 +225,22 @@ class Note(Base):
     content = Column(Text, nullable=False)
     # Optional attribution (may be blank/NULL)
     author = Column(String(120), nullable=True)
-    todo_id = Column(Integer, ForeignKey("todos.id"), nullable=True)
+    todo_id = Column(Integer, ForeignKey("todos.id"), nullable=True, index=True)
     # New in schema v5:
     # - note_type: explicit type (project vs attached) for filtering/UX
     # - category: lightweight categorization (e.g., "research")
     note_type = Column(SQLEnum(NoteType), nullable=False, default=NoteType.PROJECT, index=True)
     category = Column(String(80), nullable=False, default="general", index=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, server_default=func.current_timestamp(), nullable=False)
     
     # Relationships
     todo = relationship("Todo", back_populates="notes")
 
+    __table_args__ = (
+        # get_notes() filtering on both type and category
+        Index("ix_notes_type_category", note_type, category),
+    )
+
 
 class TodoRelation(Base):
     """
@@ -179,9 +250,9 @@ class TodoRelation(Base):
     __tablename__ = "todo_relations"
 
     id = Column(Integer, primary_key=True, index=True)
-    todo_id = Column(Integer, ForeignKey("todos.id"), nullable=False)
-    relates_to_id = Column(Integer, ForeignKey("todos.id"), nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    todo_id = Column(Integer, ForeignKey("todos.id"), nullable=False, index=True)
+    relates_to_id = Column(Integer, ForeignKey("todos.id"), nullable=False, index=True)
+    created_at = Column(DateTime, default=func.current_timestamp(), server_default=func.current_timestamp(), nullable=False)
 
     todo = relationship("Todo", foreign_keys=[todo_id], back_populates="relations", overlaps="related_from")
     relates_to = relationship("Todo", foreign_keys=[relates_to_id], overlaps="related_from,relations")
@@ -194,11 +265,11 @@ class TodoAttachment(Base):
     __tablename__ = "todo_attachments"
 
     id = Column(Integer, primary_key=True, index=True)
-    todo_id = Column(Integer, ForeignKey("todos.id"), nullable=False)
+    todo_id = Column(Integer, ForeignKey("todos.id"), nullable=False, index=True)
     file_path = Column(Text, nullable=False)
     file_name = Column(String(255), nullable=False)
     file_size = Column(Integer, nullable=True)
-    uploaded_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    uploaded_at = Column(DateTime, default=datetime.utcnow, server_default=func.current_timestamp(), nullable=False)
 
     todo = relationship("Todo", back_populates="attachments")
 
@@ -211,9 +282,9 @@ class TodoDependency(Base):
     __tablename__ = "todo_dependencies"
 
     id = Column(Integer, primary_key=True, index=True)
-    todo_id = Column(Integer, ForeignKey("todos.id"), nullable=False)
-    depends_on_id = Column(Integer, ForeignKey("todos.id"), nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    todo_id = Column(Integer, ForeignKey("todos.id"), nullable=False, index=True)
+    depends_on_id = Column(Integer, ForeignKey("todos.id"), nullable=False, index=True)
+    created_at = Column(DateTime, default=datetime.utcnow, server_default=func.current_timestamp(), nullable=False)
     
     # Relationships
     todo = relationship("Todo", foreign_keys=[todo_id], back_populates="dependencies")
@@ -229,22 +300,30 @@ class Tag(Base):
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(50), unique=True, nullable=False, index=True)
     description = Column(String(200), nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, default=func.current_timestamp(), server_default=func.current_timestamp(), nullable=False)
     
     # Relationships
     todos = relationship("Todo", secondary="todo_tags", back_populates="tags")
 
 
-class TodoTag(Base):
-    """
-    Association table for many-to-many relationship between todos and tags.
-    """
-    __tablename__ = "todo_tags"
-
-    id = Column(Integer, primary_key=True, index=True)
-    todo_id = Column(Integer, ForeignKey("todos.id"), nullable=False)
-    tag_id = Column(Integer, ForeignKey("tags.id"), nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+# Association table for the many-to-many relationship between todos and tags.
+# A plain Table rather than a mapped class: it is only ever used as
+# `secondary=` and in Core queries, so no ORM identity or surrogate id is
+# needed; (todo_id, tag_id) is the key. Databases created before this keep
+# their old `id` column, which SQLite fills in on insert.
+#
+# New databases store it WITHOUT ROWID, clustered on (todo_id, tag_id), so a
+# todo's tags are one B-tree range; ix_todo_tags_tag covers the tag -> todos
+# direction (tag filters in search_todos).
+todo_tags = Table(
+    "todo_tags",
+    Base.metadata,
+    Column("todo_id", Integer, ForeignKey("todos.id"), primary_key=True),
+    Column("tag_id", Integer, ForeignKey("tags.id"), primary_key=True),
+    Column("created_at", DateTime, default=func.current_timestamp(), server_default=func.current_timestamp(), nullable=False),
+    Index("ix_todo_tags_tag", "tag_id", "todo_id"),
+    sqlite_with_rowid=False,
+)
 
 
 class SchemaVersion(Base):
@@ -256,11 +335,68 @@ class SchemaVersion(Base):
     
     id = Column(Integer, primary_key=True, index=True)
     version = Column(Integer, nullable=False, index=True)
-    applied_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    applied_at = Column(DateTime, default=datetime.utcnow, server_default=func.current_timestamp(), nullable=False)
     todotracker_version = Column(String(20), nullable=False)
     description = Column(Text, nullable=True)
 
 
+# Todo collections filled from another row's foreign key:
+# (model, fk attribute, Todo collection). Sessions don't expire on commit, so
+# a row written through the FK column (Note(todo_id=...), db.delete(note), a
+# changed parent_id) would leave an already-loaded collection stale.
+_TODO_FK_COLLECTIONS = (
+    (Todo, "parent_id", "children"),
+    (Note, "todo_id", "notes"),
+    (TodoDependency, "todo_id", "dependencies"),
+    (TodoRelation, "todo_id", "relations"),
+    (TodoRelation, "relates_to_id", "related_from"),
+    (TodoAttachment, "todo_id", "attachments"),
+)
+
+
+def expire_todo_collection(db, todo_id, collection: str) -> None:
+    """Expire `collection` on todo `todo_id` if it is loaded in this session."""
+    todo = db.identity_map.get(db.identity_key(Todo, todo_id))
+    if todo is not None and collection in todo.__dict__:
+        db.expire(todo, [collection])
+
+
+@event.listens_for(Session, "after_flush")
+def _expire_stale_todo_collections(db, flush_context) -> None:
+    for obj in chain(db.new, db.dirty, db.deleted):
+        for model, fk, collection in _TODO_FK_COLLECTIONS:
+            if not isinstance(obj, model):
+                continue
+            history = inspect(obj).attrs[fk].history
+            # New/changed rows: added (+ deleted when re-pointed);
+            # deleted rows: unchanged.
+            for todo_id in chain(history.added, history.deleted, history.unchanged):
+                if todo_id is not None:
+                    expire_todo_collection(db, todo_id, collection)
+
+
+# start path -> the .todos/project.db found walking up from it. Only hits are
+# cached: a miss is walked again next time, so a long-running process still
+# finds a project database created after its first lookup.
+_PROJECT_DB_BY_START_PATH: Dict[str, str] = {}
+_PROJECT_DB_CACHE_MAX = 32
+
+
+def _find_project_database_from(start_path: str) -> Optional[str]:
+    current = os.path.realpath(start_path)
+    
+    # Walk up the directory tree looking for .todos/project.db, one string
+    # join + stat per level; the first hit ends the walk.
+    while True:
+        db_path = os.path.join(current, ".todos", "project.db")
+        if os.path.exists(db_path):
+            return db_path
+        parent = os.path.dirname(current)
+        if parent == current:
+            return None
+        current = parent
+
+
 def find_project_database(start_path: Optional[str] = None) -> Optional[str]:
     """
     Find the project's .todos/project.db by walking up from the start path.
@@ -268,19 +404,27 @@ def find_project_database(start_path: Optional[str] = None) -> Optional[str]:
     
     This allows TodoTracker to automatically detect and use per-project databases
     without requiring environment variables.
+
+    Hits are memoized per start path and re-checked with a single stat; misses
+    aren't cached. find_project_database.cache_clear() forgets all hits (e.g.
+    after creating a .todos directory nearer to the start path).
     """
     if start_path is None:
         start_path = os.getcwd()
-    
-    current = Path(start_path).resolve()
-    
-    # Walk up the directory tree looking for .todos/project.db
-    for parent in [current] + list(current.parents):
-        db_path = parent / ".todos" / "project.db"
-        if db_path.exists():
-            return str(db_path)
-    
-    return None
+    cached = _PROJECT_DB_BY_START_PATH.get(start_path)
+    if cached is not None and os.path.exists(cached):
+        return cached
+    found = _find_project_database_from(start_path)
+    if found is None:
+        _PROJECT_DB_BY_START_PATH.pop(start_path, None)
+    else:
+        if len(_PROJECT_DB_BY_START_PATH) >= _PROJECT_DB_CACHE_MAX:
+            _PROJECT_DB_BY_START_PATH.clear()
+        _PROJECT_DB_BY_START_PATH[start_path] = found
+    return found
+
+
+find_project_database.cache_clear = _PROJECT_DB_BY_START_PATH.clear
 
 
 # Database configuration
@@ -309,23 +453,57 @@ _SessionLocalMaker = None
 DB_PATH = None
 DATABASE_URL = None
 
-# Per-db cache for multi-project usage (e.g., per MCP tool call).
-# Keyed by absolute db_path.
-_ENGINE_BY_DB_PATH: Dict[str, Engine] = {}
-_SESSIONMAKER_BY_DB_PATH: Dict[str, sessionmaker] = {}
-_INITIALIZED_DB_PATHS: Set[str] = set()
+# Serializes engine creation + schema setup for per-db engines (see
+# _get_or_create_engine_and_sessionmaker); lookups of existing ones don't take it.
+_ENGINE_INIT_LOCK = threading.Lock()
+_ENGINE_BY_DB_PATH: Dict[str, tuple[Engine, scoped_session]] = {}
 
 
-def _normalize_db_path(db_path: str) -> str:
+@lru_cache(maxsize=64)
+def _resolve_db_path(db_path: str) -> str:
     return str(Path(db_path).expanduser().resolve())
 
 
+def _normalize_db_path(db_path: str) -> str:
+    # resolve() stats every path component; memoize it. Relative paths are
+    # anchored to the cwd first so a chdir can't return a stale entry.
+    if not os.path.isabs(db_path) and not db_path.startswith("~"):
+        db_path = os.path.join(os.getcwd(), db_path)
+    return _resolve_db_path(db_path)
+
+
 def _ensure_db_directory(db_path: str) -> None:
     db_dir = Path(db_path).parent
     if not db_dir.exists():
         db_dir.mkdir(parents=True, exist_ok=True)
 
 
+# Applied to every new DBAPI connection. journal_mode=WAL persists in the
+# file, but the rest are per-connection settings. WAL makes
+# synchronous=NORMAL safe (a crash can only lose the last commits, never
+# corrupt the file) and drops the fsync on every commit.
+# foreign_keys stays off: existing databases rely on deleting a todo that
+# other todos still depend on.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA busy_timeout=15000",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-65536",  # 64 MB page cache (grows on demand)
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",  # 256 MB
+    "PRAGMA wal_autocheckpoint=1000",  # pages; keeps the WAL from growing unchecked
+    "PRAGMA journal_size_limit=6144000",
+)
+_SQLITE_PRAGMA_SCRIPT = ";\n".join(SQLITE_PRAGMAS) + ";"
+
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    # One executescript() call instead of a cursor round trip per PRAGMA.
+    # No transaction is open yet on a fresh connection, so its implicit
+    # COMMIT is a no-op.
+    dbapi_connection.executescript(_SQLITE_PRAGMA_SCRIPT)
+
+
 def _create_engine_for_db_path(db_path: str) -> Engine:
     database_url = f"sqlite:///{db_path}"
     eng = create_engine(
@@ -334,87 +512,168 @@ def _create_engine_for_db_path(db_path: str) -> Engine:
             "timeout": 15,
             "check_same_thread": False,
         },
-        poolclass=StaticPool,
+        # A pooled connection per concurrent session: WAL lets readers run in
+        # parallel with each other and with the single writer.
+        pool_size=5,
+        max_overflow=10,
+        # LIFO checkout reuses the most recently returned connection, whose
+        # per-connection page cache is still warm, instead of cycling
+        # through all of them.
+        pool_use_lifo=True,
+        pool_recycle=3600,
+        pool_pre_ping=True,
+        # Compiled-statement cache; the default 500 entries is tight once the
+        # lambda search variants, queue updates and loader queries add up.
+        query_cache_size=1200,
         echo=False,  # Set to True for SQL debugging
     )
 
-    # Enable WAL mode for better concurrency
-    with eng.connect() as conn:
-        conn.execute(text("PRAGMA journal_mode=WAL"))
-        conn.execute(text("PRAGMA busy_timeout=15000"))
-        conn.commit()
+    event.listen(eng, "connect", _apply_sqlite_pragmas)
     return eng
 
 
-def _get_or_create_engine_and_sessionmaker(db_path: str) -> tuple[Engine, sessionmaker]:
-    norm = _normalize_db_path(db_path)
-    if norm in _ENGINE_BY_DB_PATH and norm in _SESSIONMAKER_BY_DB_PATH:
-        return _ENGINE_BY_DB_PATH[norm], _SESSIONMAKER_BY_DB_PATH[norm]
-
-    _ensure_db_directory(norm)
-    eng = _create_engine_for_db_path(norm)
-    maker = sessionmaker(autocommit=False, autoflush=False, bind=eng)
-    _ENGINE_BY_DB_PATH[norm] = eng
-    _SESSIONMAKER_BY_DB_PATH[norm] = maker
+def _ensure_indexes(eng: Engine, existing: Optional[Set[str]] = None) -> None:
+    """
+    Create any model-declared index missing from an existing database.
+    create_all() only builds indexes together with their table, so indexes
+    added after a database was created would otherwise never appear.
+    Indexes over columns an old database doesn't have yet are skipped; they
+    are created once migrate_database() has added the columns.
+    `existing`: index names already known to be present (no probe for those).
+    """
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            if existing is not None and index.name in existing:
+                continue
+            try:
+                index.create(bind=eng, checkfirst=True)
+            except OperationalError:
+                # e.g. "no such column" on a database awaiting migration
+                pass
+
+
+def _create_missing_schema(eng: Engine) -> None:
+    """
+    create_all() + _ensure_indexes(), skipping both when one sqlite_master
+    read shows nothing is missing. create_all() and checkfirst otherwise
+    probe every table and index separately, even on an up-to-date database.
+    """
+    with eng.connect() as conn:
+        rows = conn.execute(text(
+            "SELECT type, name FROM sqlite_master WHERE type IN ('table', 'index')"
+        )).all()
+    tables = {name for kind, name in rows if kind == "table"}
+    if not tables.issuperset(Base.metadata.tables):
+        Base.metadata.create_all(bind=eng)
+    _ensure_indexes(eng, existing={name for kind, name in rows if kind == "index"})
+
+
+def _get_or_create_engine_and_sessionmaker(norm: str) -> tuple[Engine, scoped_session]:
+    """
+    Engine and session registry for a normalized db path, built once per path
+    (multi-project usage, e.g. per MCP tool call). _ENGINE_BY_DB_PATH is the
+    only cache, never evicted: dropping an entry would orphan a live engine
+    and its pool. Not lru_cache: it doesn't serialize concurrent misses, so
+    two threads could each build an engine (and pool) for the same file.
+
+    The session registry is thread-local: repeated SessionLocal(db_path) calls
+    on one thread hand back the same Session (callers still close() it).
+
+    Sessions keep loaded state across commit (expire_on_commit=False), so
+    serializing an object after a write doesn't re-SELECT it. Writes that
+    bypass the unit of work must refresh/expire what they touch (see
+    synchronize_session in crud, _expire_stale_todo_collections).
+    """
+    cached = _ENGINE_BY_DB_PATH.get(norm)
+    if cached is not None:
+        return cached
+    with _ENGINE_INIT_LOCK:
+        # Threads that missed the cache together: only the first one builds.
+        if norm in _ENGINE_BY_DB_PATH:
+            return _ENGINE_BY_DB_PATH[norm]
+        _ensure_db_directory(norm)
+        eng = _create_engine_for_db_path(norm)
+        maker = scoped_session(sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=eng))
+        _ENGINE_BY_DB_PATH[norm] = (eng, maker)
     return eng, maker
 
 
+@lru_cache(maxsize=None)
+def _ensure_schema(norm: str) -> None:
+    """
+    Create missing tables/indexes for a per-call db path, once per path.
+    Kept lightweight: callers run migrations as needed.
+    """
+    eng, _ = _get_or_create_engine_and_sessionmaker(norm)
+    with _ENGINE_INIT_LOCK:
+        _create_missing_schema(eng)
+
+
 def _init_engine():
-    """Initialize the database engine lazily."""
+    """Initialize the default database engine lazily."""
     global engine, _SessionLocalMaker, DB_PATH, DATABASE_URL
 
     if engine is not None:
         return  # Already initialized
 
     DB_PATH = get_database_path()
-
-    # Ensure the directory exists
-    db_dir = Path(DB_PATH).parent
-    if not db_dir.exists():
-        db_dir.mkdir(parents=True, exist_ok=True)
-
     DATABASE_URL = f"sqlite:///{DB_PATH}"
-
-    engine = create_engine(
-        DATABASE_URL,
-        connect_args={
-            "timeout": 15,
-            "check_same_thread": False,
-        },
-        poolclass=StaticPool,
-        echo=False,  # Set to True for SQL debugging
-    )
-
-    # Enable WAL mode for better concurrency
-    with engine.connect() as conn:
-        conn.execute(text("PRAGMA journal_mode=WAL"))
-        conn.execute(text("PRAGMA busy_timeout=15000"))
-        conn.commit()
-
-    _SessionLocalMaker = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    # Same engine (and pragmas) as SessionLocal(DB_PATH) would get. The
+    # default path keeps handing out a fresh Session per call: web requests
+    # hold theirs across awaits, so a thread-local one could be shared.
+    eng, scoped = _get_or_create_engine_and_sessionmaker(_normalize_db_path(DB_PATH))
+    _SessionLocalMaker = scoped.session_factory
+    # Published last: other threads treat a non-None `engine` as "fully
+    # initialized" and call _SessionLocalMaker without taking any lock.
+    engine = eng
+
+
+# PRAGMA optimize lets SQLite re-ANALYZE indexes whose tables have changed
+# enough to skew the planner's statistics; it is meant to be run now and then
+# on long-lived connections. Checked (per database) as sessions are handed out.
+OPTIMIZE_INTERVAL_SECONDS = 15 * 60
+_LAST_OPTIMIZE_AT: Dict[str, float] = {}
+
+
+def _maybe_optimize(eng: Engine, norm: str) -> None:
+    """Run PRAGMA optimize on `eng` if the interval has elapsed (best-effort)."""
+    now = time.monotonic()
+    # The first session for a database only starts the clock
+    last = _LAST_OPTIMIZE_AT.setdefault(norm, now)
+    if now - last < OPTIMIZE_INTERVAL_SECONDS:
+        return
+    _LAST_OPTIMIZE_AT[norm] = now
+    try:
+        with eng.connect() as conn:
+            conn.exec_driver_sql("PRAGMA optimize")
+    except Exception:
+        # e.g. database locked; try again next interval
+        pass
 
 
 def SessionLocal(db_path: Optional[str] = None):
     """
     Return a new SQLAlchemy Session.
 
+    With an explicit db_path the session comes from that path's thread-local
+    registry, so repeated calls on the same thread reuse one Session (and its
+    identity map) between close() calls.
+
     This is intentionally a function (not a sessionmaker variable) so imports like
     `from .db import SessionLocal` always stay callable even with lazy init.
     """
     if db_path is None:
         _init_engine()
+        # Same key as the db_path branch (and the engine registry), so one
+        # file opened both ways shares one optimize timer.
+        _maybe_optimize(engine, _normalize_db_path(DB_PATH))
         return _SessionLocalMaker()
 
     # Per-call / per-project DB path
-    eng, maker = _get_or_create_engine_and_sessionmaker(db_path)
-
-    # Ensure schema exists once per db_path. We keep this lightweight: create tables,
-    # and then let callers run migrations as needed.
     norm = _normalize_db_path(db_path)
-    if norm not in _INITIALIZED_DB_PATHS:
-        Base.metadata.create_all(bind=eng)
-        _INITIALIZED_DB_PATHS.add(norm)
-
+    _ensure_schema(norm)
+    eng, maker = _get_or_create_engine_and_sessionmaker(norm)
+    _maybe_optimize(eng, norm)
     return maker()
 
 
@@ -431,10 +690,8 @@ def get_db_schema_version(db) -> int:
     Returns 0 if schema_version table doesn't exist (new or very old database).
     """
     try:
-        latest = db.query(SchemaVersion).order_by(
-            SchemaVersion.version.desc()
-        ).first()
-        return latest.version if latest else 0
+        # MAX() over the indexed column: one integer, no ORM row to build
+        return db.execute(select(func.max(SchemaVersion.version))).scalar() or 0
     except Exception:
         # Table doesn't exist - could be new database or pre-versioning
         return 0
@@ -451,6 +708,86 @@ def set_db_schema_version(db, version: int, app_version: str, description: str =
     db.commit()
 
 
+# Rewrites lowercase note_type values (see init_db) to the member names the
+# Enum column expects, in one pass over notes.
+NORMALIZE_NOTE_TYPES_SQL = text(
+    "UPDATE notes SET note_type = CASE note_type "
+    "WHEN 'attached' THEN 'ATTACHED' WHEN 'project' THEN 'PROJECT' END "
+    "WHERE note_type IN ('attached', 'project')"
+)
+
+
+# Queue is only meaningful for active work (pending/in_progress): clear stale
+# queue values on completed/cancelled items and renumber the queued ones
+# 1..N in their current order, as one statement. Only rows whose value
+# actually changes are written. Statuses are compared by member name, which
+# is what the Enum column stores.
+NORMALIZE_QUEUE_SQL = text("""
+    WITH ranked AS (
+        SELECT id, queue, ROW_NUMBER() OVER (ORDER BY queue ASC, id ASC) AS rn
+        FROM todos
+        WHERE queue > 0 AND status IN ('PENDING', 'IN_PROGRESS')
+    )
+    UPDATE todos
+    SET queue = CASE
+        WHEN status NOT IN ('PENDING', 'IN_PROGRESS') THEN 0
+        ELSE (SELECT rn FROM ranked WHERE ranked.id = todos.id)
+    END
+    WHERE (status NOT IN ('PENDING', 'IN_PROGRESS') AND queue <> 0)
+       OR id IN (SELECT id FROM ranked WHERE rn <> queue)
+""")
+
+
+# Tags seeded into every new project database by init_db().
+_STOCK_TAGS: tuple[tuple[str, str], ...] = (
+    # Technical areas
+    ("ui", "User Interface"),
+    ("gui", "Graphical User Interface"),
+    ("backend", "Backend/Server-side"),
+    ("frontend", "Frontend/Client-side"),
+    ("api", "API Development"),
+    ("database", "Database related"),
+    ("authentication", "Auth/Login/Security"),
+    ("performance", "Performance optimization"),
+    ("testing", "Testing and QA"),
+    ("documentation", "Documentation"),
+
+    # Task types
+    ("refactoring", "Code refactoring"),
+    ("cleanup", "Code cleanup"),
+    ("optimization", "Optimization"),
+    ("security", "Security related"),
+    ("accessibility", "Accessibility"),
+
+    # Priority/urgency
+    ("urgent", "Urgent task"),
+    ("blocker", "Blocking other work"),
+    ("nice-to-have", "Nice to have"),
+
+    # Complexity
+    ("simple", "Simple task"),
+    ("complex", "Complex task"),
+
+    # Specific features
+    ("layout", "Layout and positioning"),
+    ("styling", "CSS/Styling"),
+    ("responsive", "Responsive design"),
+    ("mobile", "Mobile specific"),
+    ("desktop", "Desktop specific"),
+    ("forms", "Forms and input"),
+    ("validation", "Input validation"),
+    ("error-handling", "Error handling"),
+    ("logging", "Logging"),
+    ("monitoring", "Monitoring"),
+
+    # Integration
+    ("integration", "Third-party integration"),
+    ("deployment", "Deployment related"),
+    ("devops", "DevOps"),
+    ("ci-cd", "CI/CD pipeline"),
+)
+
+
 def init_db():
     """Initialize the database, creating all tables with version tracking."""
     from .version import SCHEMA_VERSION, __version__, get_changelog
@@ -459,7 +796,7 @@ def init_db():
     # Ensure engine is initialized
     _init_engine()
 
-    Base.metadata.create_all(bind=engine)
+    _create_missing_schema(engine)
     
     # Check and set schema version
     db = SessionLocal()
@@ -489,95 +826,33 @@ def init_db():
             print(f"⚠️  WARNING: Database schema v{current_version} is NEWER than TodoTracker v{SCHEMA_VERSION}")
             print("   Please upgrade TodoTracker to use this database.")
 
-        # Queue is only meaningful for active work (pending/in_progress). Clean up any
-        # stale queue values on completed/cancelled items, and renumber queue contiguously.
+        # Startup cleanup, committed together with the stock tag seed below
+        # (one transaction, one WAL sync). Best-effort: if the DB is
+        # old/unusual, runtime CRUD enforcement still applies.
+        normalized = False
         try:
-            db.execute(text(
-                "UPDATE todos SET queue = 0 "
-                "WHERE status NOT IN ('pending', 'in_progress') AND queue <> 0"
-            ))
-            # Renumber queued items to 1..N in current ordering.
-            db.execute(text("""
-                WITH ranked AS (
-                    SELECT id, ROW_NUMBER() OVER (ORDER BY queue ASC, id ASC) AS rn
-                    FROM todos
-                    WHERE queue > 0 AND status IN ('pending', 'in_progress')
-                )
-                UPDATE todos
-                SET queue = (SELECT rn FROM ranked WHERE ranked.id = todos.id)
-                WHERE id IN (SELECT id FROM ranked)
-            """))
-            db.commit()
+            db.execute(NORMALIZE_QUEUE_SQL)
+            # Notes: normalize enum storage for note_type (historical v5 migration wrote lowercase in some DBs).
+            # SQLAlchemy Enum mapping expects member names ("ATTACHED"/"PROJECT").
+            db.execute(NORMALIZE_NOTE_TYPES_SQL)
+            normalized = True
         except Exception:
-            # Best-effort cleanup; if the DB is old/unusual, runtime CRUD enforcement still applies.
             db.rollback()
 
-        # Notes: normalize enum storage for note_type (historical v5 migration wrote lowercase in some DBs).
-        # SQLAlchemy Enum mapping expects member names ("ATTACHED"/"PROJECT").
-        try:
-            db.execute(text("UPDATE notes SET note_type = 'ATTACHED' WHERE note_type = 'attached'"))
-            db.execute(text("UPDATE notes SET note_type = 'PROJECT' WHERE note_type = 'project'"))
-            db.commit()
-        except Exception:
-            db.rollback()
-        
         # Create stock tags if they don't exist
-        existing_tags = db.query(Tag).count()
-        if existing_tags == 0:
-            stock_tags = [
-                # Technical areas
-                ("ui", "User Interface"),
-                ("gui", "Graphical User Interface"),
-                ("backend", "Backend/Server-side"),
-                ("frontend", "Frontend/Client-side"),
-                ("api", "API Development"),
-                ("database", "Database related"),
-                ("authentication", "Auth/Login/Security"),
-                ("performance", "Performance optimization"),
-                ("testing", "Testing and QA"),
-                ("documentation", "Documentation"),
-                
-                # Task types
-                ("refactoring", "Code refactoring"),
-                ("cleanup", "Code cleanup"),
-                ("optimization", "Optimization"),
-                ("security", "Security related"),
-                ("accessibility", "Accessibility"),
-                
-                # Priority/urgency
-                ("urgent", "Urgent task"),
-                ("blocker", "Blocking other work"),
-                ("nice-to-have", "Nice to have"),
-                
-                # Complexity
-                ("simple", "Simple task"),
-                ("complex", "Complex task"),
-                
-                # Specific features
-                ("layout", "Layout and positioning"),
-                ("styling", "CSS/Styling"),
-                ("responsive", "Responsive design"),
-                ("mobile", "Mobile specific"),
-                ("desktop", "Desktop specific"),
-                ("forms", "Forms and input"),
-                ("validation", "Input validation"),
-                ("error-handling", "Error handling"),
-                ("logging", "Logging"),
-                ("monitoring", "Monitoring"),
-                
-                # Integration
-                ("integration", "Third-party integration"),
-                ("deployment", "Deployment related"),
-                ("devops", "DevOps"),
-                ("ci-cd", "CI/CD pipeline"),
-            ]
-            
-            for tag_name, tag_desc in stock_tags:
-                tag = Tag(name=tag_name, description=tag_desc)
-                db.add(tag)
-            
-            db.commit()
-            print(f"✓ Created {len(stock_tags)} stock tags")
+        # One INSERT ... ON CONFLICT DO NOTHING (executemany): a no-op on a
+        # seeded database, so there's no separate count() round trip first.
+        result = db.execute(
+            sqlite_insert(Tag.__table__).on_conflict_do_nothing(index_elements=["name"]),
+            [{"name": tag_name, "description": tag_desc} for tag_name, tag_desc in _STOCK_TAGS],
+        )
+        db.commit()
+        if result.rowcount:
+            print(f"✓ Created {result.rowcount} stock tags")
+        if normalized:
+            # Schema is current and note types normalized: get_db() can skip
+            # its first-request version check + normalization for this path.
+            _AUTO_MIGRATED_DB_PATHS.add(get_db_path())
     finally:
         db.close()
 
@@ -593,26 +868,27 @@ def get_db():
         from .version import SCHEMA_VERSION
         db_path = get_db_path()
         if db_path and db_path not in _AUTO_MIGRATED_DB_PATHS:
-            try:
-                current_version = get_db_schema_version(db)
-                if current_version < SCHEMA_VERSION:
-                    from .migrations import migrate_database
-                    db.close()
-                    ok = migrate_database(db_path, interactive=False)
-                    if not ok:
-                        raise RuntimeError("Database migration failed or was skipped")
-                    db = SessionLocal()
-                # Normalize note_type enum storage (see init_db note).
-                try:
-                    db.execute(text("UPDATE notes SET note_type = 'ATTACHED' WHERE note_type = 'attached'"))
-                    db.execute(text("UPDATE notes SET note_type = 'PROJECT' WHERE note_type = 'project'"))
-                    db.commit()
-                except Exception:
-                    db.rollback()
-                _AUTO_MIGRATED_DB_PATHS.add(db_path)
-            except Exception:
-                # If migration fails, let normal request handling surface the error.
-                pass
+            with _AUTO_MIGRATE_LOCK:
+                if db_path not in _AUTO_MIGRATED_DB_PATHS:
+                    try:
+                        current_version = get_db_schema_version(db)
+                        if current_version < SCHEMA_VERSION:
+                            from .migrations import migrate_database
+                            db.close()
+                            ok = migrate_database(db_path, interactive=False)
+                            if not ok:
+                                raise RuntimeError("Database migration failed or was skipped")
+                            db = SessionLocal()
+                        # Normalize note_type enum storage (see init_db note).
+                        try:
+                            db.execute(NORMALIZE_NOTE_TYPES_SQL)
+                            db.commit()
+                        except Exception:
+                            db.rollback()
+                        _AUTO_MIGRATED_DB_PATHS.add(db_path)
+                    except Exception:
+                        # If migration fails, let normal request handling surface the error.
+                        pass
         yield db
     finally:
         db.close()
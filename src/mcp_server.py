@@ -8,6 +8,7 @@ import asyncio
 import json
 import sys
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
 from mcp.server import Server
@@ -15,11 +16,14 @@ from mcp.server.stdio import stdio_server
 from mcp.types import (
     Tool,
     TextContent,
+    CallToolResult,
     ImageContent,
     EmbeddedResource,
     INTERNAL_ERROR,
 )
 from pydantic import ValidationError
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
 
 from .db import init_db, SessionLocal, TodoCategory, TodoStatus, TodoDependency, get_db_path
 from .project_config import ProjectConfig, find_project_config
@@ -32,31 +36,77 @@ def _todotracker_install_root() -> Path:
     return Path(__file__).resolve().parent.parent
 
 
-def _common_project_context_schema() -> dict:
-    # Allow the client/agent to specify the intended project on each tool call.
-    # This enables per-project databases even if the server's cwd/env is sandboxed.
-    return {
-        "project_root": {
-            "type": "string",
-            "description": "Absolute path to the target project's root directory. If provided, this call will use <project_root>/.todos/project.db",
-        },
-        "todos_dir": {
-            "type": "string",
-            "description": "Absolute path to the target project's .todos directory. If provided, this call will use <todos_dir>/project.db",
-        },
-        "db_path": {
-            "type": "string",
-            "description": "Absolute path to the target project's database file (usually <project_root>/.todos/project.db). If provided, this call will use it directly.",
-        },
-    }
+# Allow the client/agent to specify the intended project on each tool call.
+# This enables per-project databases even if the server's cwd/env is sandboxed.
+# Shared (not copied) by every tool schema; the schemas are only ever read.
+_PROJECT_CONTEXT_PROPERTIES: dict = {
+    "project_root": {
+        "type": "string",
+        "description": "Absolute path to the target project's root directory. If provided, this call will use <project_root>/.todos/project.db",
+    },
+    "todos_dir": {
+        "type": "string",
+        "description": "Absolute path to the target project's .todos directory. If provided, this call will use <todos_dir>/project.db",
+    },
+    "db_path": {
+        "type": "string",
+        "description": "Absolute path to the target project's database file (usually <project_root>/.todos/project.db). If provided, this call will use it directly.",
+    },
+}
 
 
 def _with_project_context_schema(schema: dict) -> dict:
-    props = dict(schema.get("properties", {}) or {})
-    props.update(_common_project_context_schema())
-    out = dict(schema)
-    out["properties"] = props
-    return out
+    return {**schema, "properties": {**(schema.get("properties") or {}), **_PROJECT_CONTEXT_PROPERTIES}}
+
+
+# Property schemas repeated verbatim across several tools (and their batch
+# item schemas). Shared by reference; the schemas are only ever read.
+_AUTHOR_PROPERTY: dict = {"type": "string", "description": "Optional author attribution (may be blank)."}
+_TASK_SIZE_PROPERTY: dict = {"type": "integer", "description": "Optional task size (1-5)", "minimum": 1, "maximum": 5}
+_PRIORITY_CLASS_PROPERTY: dict = {"type": "string", "description": "Optional priority class (A-E)"}
+_COMPLETION_PERCENTAGE_PROPERTY: dict = {
+    "type": "integer",
+    "description": "Optional numeric completion percentage (0-100).",
+    "minimum": 0,
+    "maximum": 100,
+}
+_AI_INSTRUCTIONS_PROPERTY: dict = {
+    "type": "object",
+    "description": "Optional AI instruction flags (JSON object), e.g. {\"research_on_web\": true}.",
+}
+# Batch item schemas use the shorter wording.
+_AI_INSTRUCTIONS_ITEM_PROPERTY: dict = {"type": "object", "description": "Optional AI instruction flags (JSON object)"}
+_DEPENDENCY_FLAG_PROPERTIES: dict = {
+    "include_dependencies": {
+        "type": "boolean",
+        "description": "If true, include dependency relationships (prerequisites + dependents).",
+        "default": False,
+    },
+    "include_dependency_status": {
+        "type": "boolean",
+        "description": "If true, include computed dependency readiness status (ready/blocked).",
+        "default": False,
+    },
+}
+_TASK_SIZE_RANGE_PROPERTIES: dict = {
+    "min_size": {
+        "type": "integer",
+        "description": "Optional minimum task_size (1-5). Filter to only include todos with task_size >= min_size.",
+        "minimum": 1,
+        "maximum": 5,
+    },
+    "max_size": {
+        "type": "integer",
+        "description": "Optional maximum task_size (1-5). Filter to only include todos with task_size <= max_size.",
+        "minimum": 1,
+        "maximum": 5,
+    },
+}
+
+
+def _abs_path(raw: str) -> str:
+    """Expand ~ and make absolute/normalized, without touching the filesystem."""
+    return os.path.abspath(os.path.expanduser(raw))
 
 
 def _resolve_db_path_from_arguments(arguments: Any) -> Optional[str]:
@@ -66,30 +116,27 @@ def _resolve_db_path_from_arguments(arguments: Any) -> Optional[str]:
       1) arguments.db_path
       2) arguments.todos_dir + "/project.db"
       3) arguments.project_root + "/.todos/project.db"
+
+    Paths are made absolute lexically (abspath, no symlink resolution);
+    SessionLocal() canonicalizes and caches the real path itself.
     """
     if not isinstance(arguments, dict):
         return None
 
-    raw_db = arguments.get("db_path")
-    if raw_db:
-        try:
-            return str(Path(raw_db).expanduser().resolve())
-        except Exception:
-            return None
+    try:
+        raw_db = arguments.get("db_path")
+        if raw_db:
+            return _abs_path(raw_db)
 
-    raw_todos_dir = arguments.get("todos_dir")
-    if raw_todos_dir:
-        try:
-            return str((Path(raw_todos_dir).expanduser().resolve() / "project.db"))
-        except Exception:
-            return None
+        raw_todos_dir = arguments.get("todos_dir")
+        if raw_todos_dir:
+            return os.path.join(_abs_path(raw_todos_dir), "project.db")
 
-    raw_root = arguments.get("project_root")
-    if raw_root:
-        try:
-            return str((Path(raw_root).expanduser().resolve() / ".todos" / "project.db"))
-        except Exception:
-            return None
+        raw_root = arguments.get("project_root")
+        if raw_root:
+            return os.path.join(_abs_path(raw_root), ".todos", "project.db")
+    except Exception:
+        return None
 
     return None
 
@@ -102,7 +149,20 @@ def _get_project_root() -> Optional[Path]:
     1) TODOTRACKER_PROJECT_ROOT (explicit, recommended)
     2) Infer from TODOTRACKER_DB_PATH if it points to <project>/.todos/project.db
     3) Infer from argv[1] if it looks like <project>/.todos/project.db
+
+    The result is cached for the process; call _refresh_project_root() after
+    changing the environment or argv.
     """
+    return _compute_project_root()
+
+
+def _refresh_project_root() -> None:
+    """Drop the cached project root so the next lookup re-reads env/argv."""
+    _compute_project_root.cache_clear()
+
+
+@lru_cache(maxsize=1)
+def _compute_project_root() -> Optional[Path]:
     env_root = os.environ.get("TODOTRACKER_PROJECT_ROOT")
     if env_root:
         try:
@@ -140,20 +200,27 @@ def find_project_database(start_path: Optional[str] = None) -> Optional[str]:
         project_root = _get_project_root()
         start_path = str(project_root) if project_root else os.getcwd()
     
-    current = Path(start_path).resolve()
+    current = os.path.realpath(start_path)
     
     # Walk up the directory tree looking for .todos/project.db
-    for parent in [current] + list(current.parents):
-        db_path = parent / ".todos" / "project.db"
-        if db_path.exists():
-            return str(db_path)
-    
-    return None
+    while True:
+        db_path = os.path.join(current, ".todos", "project.db")
+        if os.path.exists(db_path):
+            return db_path
+        parent = os.path.dirname(current)
+        if parent == current:
+            return None
+        current = parent
 
 
 # Initialize the MCP server
 app = Server("todotracker")
 
+# config.json path -> ((st_mtime_ns, st_size), subtasks_enabled). Every tool
+# call checks the flag; re-parse the file only when it has changed.
+_SUBTASKS_FLAG_CACHE: dict[str, tuple[tuple[int, int], bool]] = {}
+
+
 def _subtasks_enabled_for_db_path(db_path: Optional[str]) -> bool:
     """
     Feature flag read from <project_root>/.todos/config.json.
@@ -173,13 +240,24 @@ def _subtasks_enabled_for_db_path(db_path: Optional[str]) -> bool:
                 project_root = pc.project_root
         if project_root is None:
             return True
-        cfg = ProjectConfig(project_root).load_config()
-        if not isinstance(cfg, dict):
-            return True
-        features = cfg.get("features")
-        if not isinstance(features, dict):
+        project_config = ProjectConfig(project_root)
+        config_key = str(project_config.config_file)
+        try:
+            st = os.stat(config_key)
+        except OSError:
             return True
-        return bool(features.get("subtasks_enabled", True))
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = _SUBTASKS_FLAG_CACHE.get(config_key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        enabled = True
+        cfg = project_config.load_config()
+        if isinstance(cfg, dict):
+            features = cfg.get("features")
+            if isinstance(features, dict):
+                enabled = bool(features.get("subtasks_enabled", True))
+        _SUBTASKS_FLAG_CACHE[config_key] = (stamp, enabled)
+        return enabled
     except Exception:
         return True
 
@@ -202,11 +280,13 @@ def get_db_session():
 # TOOLS (Functions AI can call)
 # ============================================================================
 
-@app.list_tools()
-async def list_tools() -> list[Tool]:
-    """List all available tools for the AI."""
-    subtasks_enabled = _subtasks_enabled_for_call({})
-    return [
+@lru_cache(maxsize=2)
+def _build_tools(subtasks_enabled: bool) -> tuple[Tool, ...]:
+    """
+    Build the static tool table. Only the create_todo description depends on
+    the subtasks flag, so there are at most two variants; each is built once.
+    """
+    return (
         Tool(
             name="list_todos",
             title="List All Todos",
@@ -241,16 +321,7 @@ work_completed/work_remaining/implementation_issues fields to track your progres
                         "type": "integer",
                         "description": "The ID of the todo to retrieve",
                     },
-                    "include_dependencies": {
-                        "type": "boolean",
-                        "description": "If true, include dependency relationships (prerequisites + dependents).",
-                        "default": False,
-                    },
-                    "include_dependency_status": {
-                        "type": "boolean",
-                        "description": "If true, include computed dependency readiness status (ready/blocked).",
-                        "default": False,
-                    },
+                    **_DEPENDENCY_FLAG_PROPERTIES,
                 },
                 "required": ["todo_id"],
             }),
@@ -271,16 +342,7 @@ update work_completed/work_remaining/implementation_issues fields to track your
                         "minItems": 1,
                         "description": "The todo IDs to retrieve",
                     },
-                    "include_dependencies": {
-                        "type": "boolean",
-                        "description": "If true, include dependency relationships (prerequisites + dependents).",
-                        "default": False,
-                    },
-                    "include_dependency_status": {
-                        "type": "boolean",
-                        "description": "If true, include computed dependency readiness status (ready/blocked).",
-                        "default": False,
-                    },
+                    **_DEPENDENCY_FLAG_PROPERTIES,
                 },
                 "required": ["todo_ids"],
             }),
@@ -325,10 +387,7 @@ update work_completed/work_remaining/implementation_issues fields to track your
                         "type": "string",
                         "description": "Optional topic/theme for grouping related todos (e.g., 'window layout', 'authentication')",
                     },
-                    "author": {
-                        "type": "string",
-                        "description": "Optional author attribution (may be blank).",
-                    },
+                    "author": _AUTHOR_PROPERTY,
                     "tags": {
                         "type": "array",
                         "items": {"type": "string"},
@@ -358,20 +417,9 @@ update work_completed/work_remaining/implementation_issues fields to track your
                         "minimum": 1,
                         "maximum": 5,
                     },
-                    "priority_class": {
-                        "type": "string",
-                        "description": "Optional priority class (A-E)",
-                    },
-                    "completion_percentage": {
-                        "type": "integer",
-                        "description": "Optional numeric completion percentage (0-100).",
-                        "minimum": 0,
-                        "maximum": 100,
-                    },
-                    "ai_instructions": {
-                        "type": "object",
-                        "description": "Optional AI instruction flags (JSON object), e.g. {\"research_on_web\": true}.",
-                    },
+                    "priority_class": _PRIORITY_CLASS_PROPERTY,
+                    "completion_percentage": _COMPLETION_PERCENTAGE_PROPERTY,
+                    "ai_instructions": _AI_INSTRUCTIONS_PROPERTY,
                 },
                 "required": ["title"],
             }),
@@ -405,7 +453,7 @@ update work_completed/work_remaining/implementation_issues fields to track your
                                 },
                                 "parent_id": {"type": "integer", "description": "Parent todo ID. If set, this todo is a subtask and will appear nested under its parent in the UI."},
                                 "topic": {"type": "string", "description": "Optional topic/theme"},
-                                "author": {"type": "string", "description": "Optional author attribution (may be blank)."},
+                                "author": _AUTHOR_PROPERTY,
                                 "tags": {"type": "array", "items": {"type": "string"}, "description": "Optional list of tags"},
                                 "depends_on_id": {
                                     "type": "integer",
@@ -415,10 +463,10 @@ update work_completed/work_remaining/implementation_issues fields to track your
                                 "work_remaining": {"type": "string", "description": "PROGRESS TRACKING: What still needs to be done"},
                                 "implementation_issues": {"type": "string", "description": "PROGRESS TRACKING: Known problems, blockers, or concerns"},
                                 "queue": {"type": "integer", "description": "Execution queue position. 0 means not in queue.", "minimum": 0, "default": 0},
-                                "task_size": {"type": "integer", "description": "Optional task size (1-5)", "minimum": 1, "maximum": 5},
-                                "priority_class": {"type": "string", "description": "Optional priority class (A-E)"},
-                                "completion_percentage": {"type": "integer", "description": "Optional numeric completion percentage (0-100).", "minimum": 0, "maximum": 100},
-                                "ai_instructions": {"type": "object", "description": "Optional AI instruction flags (JSON object)"},
+                                "task_size": _TASK_SIZE_PROPERTY,
+                                "priority_class": _PRIORITY_CLASS_PROPERTY,
+                                "completion_percentage": _COMPLETION_PERCENTAGE_PROPERTY,
+                                "ai_instructions": _AI_INSTRUCTIONS_ITEM_PROPERTY,
                             },
                             "required": ["title"],
                         },
@@ -566,10 +614,7 @@ update work_completed/work_remaining/implementation_issues fields to track your
                         "type": "string",
                         "description": "Topic/theme for grouping",
                     },
-                    "author": {
-                        "type": "string",
-                        "description": "Optional author attribution (may be blank).",
-                    },
+                    "author": _AUTHOR_PROPERTY,
                     "tags": {
                         "type": "array",
                         "items": {"type": "string"},
@@ -605,26 +650,10 @@ update work_completed/work_remaining/implementation_issues fields to track your
                         "description": "Execution queue position. 0 means not in queue. Lower numbers execute first.",
                         "minimum": 0,
                     },
-                    "task_size": {
-                        "type": "integer",
-                        "description": "Optional task size (1-5)",
-                        "minimum": 1,
-                        "maximum": 5,
-                    },
-                    "priority_class": {
-                        "type": "string",
-                        "description": "Optional priority class (A-E)",
-                    },
-                    "completion_percentage": {
-                        "type": "integer",
-                        "description": "Optional numeric completion percentage (0-100).",
-                        "minimum": 0,
-                        "maximum": 100,
-                    },
-                    "ai_instructions": {
-                        "type": "object",
-                        "description": "Optional AI instruction flags (JSON object), e.g. {\"research_on_web\": true}.",
-                    },
+                    "task_size": _TASK_SIZE_PROPERTY,
+                    "priority_class": _PRIORITY_CLASS_PROPERTY,
+                    "completion_percentage": _COMPLETION_PERCENTAGE_PROPERTY,
+                    "ai_instructions": _AI_INSTRUCTIONS_PROPERTY,
                 },
                 "required": ["todo_id"],
             }),
@@ -655,10 +684,10 @@ update work_completed/work_remaining/implementation_issues fields to track your
                                 "remaining_work": {"type": "string", "description": "DEPRECATED: Use work_remaining instead"},
                                 "category": {"type": "string", "enum": ["feature", "issue", "bug"], "description": "New category"},
                                 "queue": {"type": "integer", "description": "Execution queue position. 0 means not in queue.", "minimum": 0},
-                                "task_size": {"type": "integer", "description": "Optional task size (1-5)", "minimum": 1, "maximum": 5},
-                                "priority_class": {"type": "string", "description": "Optional priority class (A-E)"},
-                                "completion_percentage": {"type": "integer", "description": "Optional numeric completion percentage (0-100).", "minimum": 0, "maximum": 100},
-                                "ai_instructions": {"type": "object", "description": "Optional AI instruction flags (JSON object)"},
+                                "task_size": _TASK_SIZE_PROPERTY,
+                                "priority_class": _PRIORITY_CLASS_PROPERTY,
+                                "completion_percentage": _COMPLETION_PERCENTAGE_PROPERTY,
+                                "ai_instructions": _AI_INSTRUCTIONS_ITEM_PROPERTY,
                             },
                             "required": ["todo_id"],
                         },
@@ -706,18 +735,7 @@ Note: When starting work on any returned todo, call update_todo to update progre
                         "description": "Optional limit on number of results. If not provided, returns all queued todos.",
                         "minimum": 1,
                     },
-                    "min_size": {
-                        "type": "integer",
-                        "description": "Optional minimum task_size (1-5). Filter to only include todos with task_size >= min_size.",
-                        "minimum": 1,
-                        "maximum": 5,
-                    },
-                    "max_size": {
-                        "type": "integer",
-                        "description": "Optional maximum task_size (1-5). Filter to only include todos with task_size <= max_size.",
-                        "minimum": 1,
-                        "maximum": 5,
-                    },
+                    **_TASK_SIZE_RANGE_PROPERTIES,
                 },
             }),
         ),
@@ -737,18 +755,7 @@ Note: When starting work on any returned todo, call update_todo to update progre
                         "minimum": 1,
                         "default": 10,
                     },
-                    "min_size": {
-                        "type": "integer",
-                        "description": "Optional minimum task_size (1-5). Filter to only include todos with task_size >= min_size.",
-                        "minimum": 1,
-                        "maximum": 5,
-                    },
-                    "max_size": {
-                        "type": "integer",
-                        "description": "Optional maximum task_size (1-5). Filter to only include todos with task_size <= max_size.",
-                        "minimum": 1,
-                        "maximum": 5,
-                    },
+                    **_TASK_SIZE_RANGE_PROPERTIES,
                 },
             }),
         ),
@@ -775,10 +782,7 @@ Note: When starting work on any returned todo, call update_todo to update progre
                         "type": "string",
                         "description": "Optional note category (e.g., research)",
                     },
-                    "author": {
-                        "type": "string",
-                        "description": "Optional author attribution (may be blank).",
-                    },
+                    "author": _AUTHOR_PROPERTY,
                 },
                 "required": ["content"],
             }),
@@ -816,7 +820,7 @@ Note: When starting work on any returned todo, call update_todo to update progre
                                 "content": {"type": "string", "description": "The note content"},
                                 "todo_id": {"type": "integer", "description": "Optional: Todo ID to attach the note to"},
                                 "category": {"type": "string", "description": "Optional note category (e.g., research)"},
-                                "author": {"type": "string", "description": "Optional author attribution (may be blank)."},
+                                "author": _AUTHOR_PROPERTY,
                             },
                             "required": ["content"],
                         },
@@ -853,10 +857,7 @@ Note: When starting work on any returned todo, call update_todo to update progre
                         "type": "string",
                         "description": "Optional note category (e.g., research)",
                     },
-                    "author": {
-                        "type": "string",
-                        "description": "Optional author attribution (may be blank).",
-                    },
+                    "author": _AUTHOR_PROPERTY,
                 },
                 "required": ["note_id"],
             }),
@@ -879,7 +880,7 @@ Note: When starting work on any returned todo, call update_todo to update progre
         Tool(
             name="search_todos",
             title="Search Todos",
-            description="Search and filter todos by query text, category, status, topic, or tags. Use topic to find todos in a specific area (e.g., 'window layout'). Use tags to filter by characteristics (e.g., ['ui', 'urgent']).",
+            description="Search and filter todos by query text, category, status, topic, or tags. Use topic to find todos in a specific area by topic prefix, case-insensitive (e.g., 'window' matches 'Window layout', but 'layout' does not). Use tags to filter by characteristics (e.g., ['ui', 'urgent']).",
             inputSchema=_with_project_context_schema({
                 "type": "object",
                 "properties": {
@@ -899,7 +900,7 @@ Note: When starting work on any returned todo, call update_todo to update progre
                     },
                     "topic": {
                         "type": "string",
-                        "description": "Filter by topic (e.g., 'window layout', 'authentication')",
+                        "description": "Filter by topic prefix (case-insensitive): 'auth' matches 'Authentication' and 'auth flow', but not 'OAuth'.",
                     },
                     "tags": {
                         "type": "array",
@@ -1037,12 +1038,48 @@ Note: When starting work on any returned todo, call update_todo to update progre
                 },
             }),
         ),
-    ]
+    )
 
 
-@app.call_tool()
-async def call_tool(name: str, arguments: Any) -> list[TextContent]:
+@app.list_tools()
+async def list_tools() -> list[Tool]:
+    """List all available tools for the AI."""
+    return list(_build_tools(_subtasks_enabled_for_call({})))
+
+
+@lru_cache(maxsize=1)
+def _tool_input_validators() -> dict:
+    """
+    Compiled jsonschema validators for every tool's inputSchema, by tool name.
+    The SDK's default validate_input path calls jsonschema.validate(), which
+    re-checks the schema against the metaschema and rebuilds the validator on
+    every call. The subtasks flag only changes a description, so either tool
+    table variant gives the same schemas.
+    """
+    return {tool.name: validator_for(tool.inputSchema)(tool.inputSchema) for tool in _build_tools(True)}
+
+
+def _input_validation_error(name: str, arguments: Any) -> Optional[CallToolResult]:
+    """Same check and message as the SDK's input validation, with a cached validator."""
+    validator = _tool_input_validators().get(name)
+    if validator is None:
+        return None
+    error = best_match(validator.iter_errors(arguments))
+    if error is None:
+        return None
+    return CallToolResult(
+        content=[TextContent(type="text", text=f"Input validation error: {error.message}")],
+        isError=True,
+    )
+
+
+@app.call_tool(validate_input=False)
+async def call_tool(name: str, arguments: Any) -> list[TextContent] | CallToolResult:
     """Handle tool calls from the AI."""
+    invalid = _input_validation_error(name, arguments)
+    if invalid is not None:
+        return invalid
+
     # If the caller provided a project context, use that db for THIS call.
     override_db_path = _resolve_db_path_from_arguments(arguments)
     db = SessionLocal(override_db_path) if override_db_path else get_db_session()
@@ -1074,7 +1111,7 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
             todo_id = arguments["todo_id"]
             include_dependencies = bool(arguments.get("include_dependencies", False))
             include_dependency_status = bool(arguments.get("include_dependency_status", False))
-            todo = crud.get_todo(db, todo_id)
+            todo = crud.get_todo_subtree(db, todo_id)
             if not todo:
                 return [TextContent(type="text", text=f"Todo with ID {todo_id} not found")]
             
@@ -1098,7 +1135,7 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
             for idx, raw_id in enumerate(todo_ids):
                 try:
                     todo_id = int(raw_id)
-                    todo = crud.get_todo(db, todo_id)
+                    todo = crud.get_todo_subtree(db, todo_id)
                     if not todo:
                         errors.append({"index": idx, "todo_id": todo_id, "error": "Todo not found"})
                         continue
@@ -2266,6 +2303,7 @@ async def main():
     
     # Set the database path
     os.environ["TODOTRACKER_DB_PATH"] = db_path
+    _refresh_project_root()
     
     # Initialize database
     init_db()
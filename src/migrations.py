@@ -98,66 +98,15 @@ def migrate_1_to_2(db):
     
     # Create stock tags
     print("  → Creating stock tags...")
-    stock_tags = [
-        # Technical areas
-        ("ui", "User Interface"),
-        ("gui", "Graphical User Interface"),
-        ("backend", "Backend/Server-side"),
-        ("frontend", "Frontend/Client-side"),
-        ("api", "API Development"),
-        ("database", "Database related"),
-        ("authentication", "Auth/Login/Security"),
-        ("performance", "Performance optimization"),
-        ("testing", "Testing and QA"),
-        ("documentation", "Documentation"),
-        
-        # Task types
-        ("refactoring", "Code refactoring"),
-        ("cleanup", "Code cleanup"),
-        ("optimization", "Optimization"),
-        ("security", "Security related"),
-        ("accessibility", "Accessibility"),
-        
-        # Priority/urgency
-        ("urgent", "Urgent task"),
-        ("blocker", "Blocking other work"),
-        ("nice-to-have", "Nice to have"),
-        
-        # Complexity
-        ("simple", "Simple task"),
-        ("complex", "Complex task"),
-        
-        # Specific features
-        ("layout", "Layout and positioning"),
-        ("styling", "CSS/Styling"),
-        ("responsive", "Responsive design"),
-        ("mobile", "Mobile specific"),
-        ("desktop", "Desktop specific"),
-        ("forms", "Forms and input"),
-        ("validation", "Input validation"),
-        ("error-handling", "Error handling"),
-        ("logging", "Logging"),
-        ("monitoring", "Monitoring"),
-        
-        # Integration
-        ("integration", "Third-party integration"),
-        ("deployment", "Deployment related"),
-        ("devops", "DevOps"),
-        ("ci-cd", "CI/CD pipeline"),
-    ]
-    
-    inserted = 0
-    for tag_name, tag_desc in stock_tags:
-        try:
-            db.execute(text(
-                "INSERT INTO tags (name, description, created_at) VALUES (:name, :desc, :now)"
-            ), {"name": tag_name, "desc": tag_desc, "now": datetime.utcnow()})
-            inserted += 1
-        except Exception:
-            # Tag might already exist, skip
-            pass
-    
-    print(f"  → Created {inserted} stock tags")
+    from .db import _STOCK_TAGS
+    
+    # OR IGNORE skips tags that already exist; one executemany for the lot.
+    result = db.execute(text(
+        "INSERT OR IGNORE INTO tags (name, description, created_at) "
+        "VALUES (:name, :desc, CURRENT_TIMESTAMP)"
+    ), [{"name": tag_name, "desc": tag_desc} for tag_name, tag_desc in _STOCK_TAGS])
+    
+    print(f"  → Created {result.rowcount} stock tags")
     db.commit()
 
 
@@ -579,6 +528,10 @@ def migrate_database(db_path: str, interactive: bool = True) -> bool:
                     db.rollback()
                     raise MigrationError(f"Migration failed: {e}")
         
+        # Indexes over columns the migrations just added
+        from .db import _ensure_indexes
+        _ensure_indexes(db.get_bind())
+        
         print("\n" + "="*60)
         print("✅ All migrations completed successfully!")
         print("="*60)
@@ -197,10 +197,9 @@ def unregister_server(port: int):
 
 def get_all_servers() -> List[Dict]:
     """Get all registered servers (after cleanup)."""
-    cleanup_stale_servers()
-    registry = load_registry()
-    
-    servers = registry.get("servers", [])
+    # cleanup_stale_servers() already probed every PID and returns the survivors,
+    # so there's no need to re-read the registry or probe each process again.
+    servers = cleanup_stale_servers()
     
     # Enrich with uptime information
     for server in servers:
@@ -224,8 +223,8 @@ def get_all_servers() -> List[Dict]:
         else:
             server["uptime"] = "unknown"
         
-        # Check if process is still alive
-        server["is_running"] = is_process_running(server.get("pid"))
+        # Only live processes survive cleanup_stale_servers()
+        server["is_running"] = True
     
     return servers
 
@@ -4,6 +4,7 @@ Stores and retrieves project-specific settings like the TodoTracker installation
 """
 
 import json
+from itertools import chain
 from pathlib import Path
 from typing import Optional
 
@@ -104,7 +105,7 @@ def find_project_config(start_path: Optional[Path] = None) -> Optional[ProjectCo
     current = Path(start_path).resolve()
     
     # Walk up the directory tree looking for .todos/config.json
-    for parent in [current] + list(current.parents):
+    for parent in chain((current,), current.parents):
         config_file = parent / ".todos" / ProjectConfig.CONFIG_FILENAME
         if config_file.exists():
             return ProjectConfig(parent)
@@ -0,0 +1,31 @@
+"""
+In-process virtualenv activation for TodoTracker's entry-point scripts.
+Lets dashboard.py and scripts/migrate_cli.py use the project's .venv without
+re-launching the interpreter under `uv run`.
+"""
+
+import os
+import site
+import sys
+import sysconfig
+from pathlib import Path
+
+
+def activate_venv(venv: Path) -> bool:
+    """
+    Put an existing virtualenv's site-packages ahead of the ambient ones.
+    The directory comes from sysconfig, so the layout matches the platform
+    (lib/pythonX.Y/site-packages on POSIX, Lib/site-packages on Windows).
+    Returns False, changing nothing, if `venv` isn't a usable virtualenv.
+    """
+    if not (venv / 'pyvenv.cfg').is_file():
+        return False
+    site_packages = sysconfig.get_path("purelib", vars={"base": str(venv), "platbase": str(venv)})
+    if not os.path.isdir(site_packages):
+        return False
+    # Prepend first: addsitedir then only processes the .pth files, since the
+    # directory is already on sys.path
+    sys.path.insert(0, site_packages)
+    site.addsitedir(site_packages)
+    os.environ['VIRTUAL_ENV'] = str(venv)
+    return True
@@ -7,7 +7,7 @@ from fastapi import FastAPI, Request, Depends, HTTPException, Form, UploadFile,
 from fastapi.responses import HTMLResponse, RedirectResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 from typing import Optional
 from pathlib import Path
 import os
@@ -807,7 +807,7 @@ async def api_delete_dependency(dependency_id: int, db: Session = Depends(get_db
 async def export_json(db: Session = Depends(get_db)):
     """Export entire database to JSON format."""
     # Get all data
-    todos = crud.get_todos(db, limit=100000)
+    todos = db.query(Todo).options(selectinload(Todo.tags)).limit(100000).all()
     notes = db.query(Note).all()
     dependencies = db.query(TodoDependency).all()
     
@@ -878,7 +878,7 @@ async def export_json(db: Session = Depends(get_db)):
 @app.get("/api/export/csv")
 async def export_csv(db: Session = Depends(get_db)):
     """Export todos to CSV format."""
-    todos = crud.get_todos(db, limit=100000)
+    todos = db.query(Todo).options(selectinload(Todo.tags)).limit(100000).all()
     
     # Create CSV in memory
     output = io.StringIO()